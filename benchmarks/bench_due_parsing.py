@@ -0,0 +1,89 @@
+"""Time due-date resolution at the call sites a coordinator update reaches.
+
+Usage::
+
+    python benchmarks/bench_due_parsing.py [--items 20000] [--projects 40] [--refreshes 20]
+
+Unlike the other scripts this one needs Home Assistant installed, because due
+dates are resolved with ``homeassistant.util.dt``. Tasks from the synthetic
+``bench_sync_decode`` payload (every third one given a timed due) are spread
+over ``--projects`` projects and resolved the way the integration does it:
+
+* a full sync builds the calendar interval index with ``due_window`` (never
+  cached) and rebuilds every project's todo list with ``resolve_due``;
+* a delta that touches one task rebuilds only that project's todo list, where
+  the project's other, unchanged dues are served by the ``resolve_due`` cache.
+
+The delta rebuild is reported with the cache bypassed (``uncached``) and warm.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+import types
+
+from bench_sync_decode import SYNC_API, build_payload
+
+
+def load_due_modules():
+    """Import sync_api.py and due.py without running the package ``__init__``."""
+    package = types.ModuleType("todoist_sync_bench")
+    package.__path__ = [str(SYNC_API.parent)]
+    sys.modules[package.__name__] = package
+    return (
+        importlib.import_module(f"{package.__name__}.sync_api"),
+        importlib.import_module(f"{package.__name__}.due"),
+    )
+
+
+def build_tasks(api, count: int, projects: int) -> list:
+    items = build_payload(count)["items"]
+    for index, item in enumerate(items):
+        item["project_id"] = f"p{index % projects}"
+        if index % 3 == 0:
+            due = item["due"]
+            due["datetime"] = f"{due['date']}T{8 + index % 10:02d}:30:00Z"
+            due["date"] = due["datetime"]
+    return [api.SyncTask.from_json(item) for item in items]
+
+
+def timed(tasks: list, resolve) -> float:
+    started = time.perf_counter()
+    for task in tasks:
+        resolve(task.due)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--projects", type=int, default=40)
+    parser.add_argument("--refreshes", type=int, default=20)
+    args = parser.parse_args()
+
+    api, due = load_due_modules()
+    tasks = build_tasks(api, args.items, args.projects)
+    project = [task for task in tasks if task.project_id == "p0"]
+
+    def uncached(value):
+        if value is None:
+            return None
+        return due._resolve(value.date, value.datetime, value.timezone)
+
+    due.clear_due_cache()
+    index = timed(tasks, due.due_window)
+    lists = timed(tasks, due.resolve_due)
+    plain = sum(timed(project, uncached) for _ in range(args.refreshes)) / args.refreshes
+    warm = sum(timed(project, due.resolve_due) for _ in range(args.refreshes)) / args.refreshes
+    print(f"tasks: {args.items} in {args.projects} projects, due values cached: {len(due._CACHE)}")
+    print(f"full sync: calendar index {index * 1000:.1f} ms, todo lists {lists * 1000:.1f} ms (cold cache)")
+    print(
+        f"    delta: one todo list ({len(project)} tasks) uncached {plain * 1000:.2f} ms, "
+        f"cached {warm * 1000:.2f} ms ({100 * (1 - warm / plain):.0f}% less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare the stdlib and orjson codecs on Sync encode/decode paths.
+
+Usage::
+
+    python benchmarks/bench_json_codec.py [--items 20000] [--payload recorded.json]
+
+``--payload`` accepts a recorded Sync response body (for example one saved
+from the diagnostics download with raw response retention enabled); otherwise
+a synthetic full sync is generated. Three paths are timed per codec: decoding
+the whole body, stream-decoding it with ``SyncStreamDecoder`` and encoding a
+100-command request.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import timeit
+import uuid
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_sync_decode import build_payload, load_sync_api  # noqa: E402
+
+
+def command_payload(api) -> dict:
+    return {
+        "sync_token": "x" * 40,
+        "resource_types": ["items"],
+        "commands": [
+            {
+                "type": "item_update",
+                "uuid": uuid.uuid4().hex,
+                "args": {"id": str(6_000_000_000 + index), "content": f"Chore {index}", "priority": 2},
+            }
+            for index in range(api.SYNC_COMMAND_LIMIT)
+        ],
+    }
+
+
+def stream_decode(api, codec, body: bytes) -> None:
+    decoder = api.SyncStreamDecoder(codec)
+    for offset in range(0, len(body), api.STREAM_CHUNK_SIZE):
+        decoder.feed(body[offset : offset + api.STREAM_CHUNK_SIZE])
+    decoder.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--payload", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    api = load_sync_api()
+    if args.payload:
+        body = args.payload.read_bytes()
+    else:
+        body = json.dumps(build_payload(args.items), separators=(",", ":")).encode()
+    commands = command_payload(api)
+    print(f"payload: {len(body) / 2**20:.1f} MiB")
+
+    codecs = [api.select_codec("json")]
+    if api.orjson is not None:
+        codecs.append(api.select_codec("orjson"))
+    else:
+        print("orjson is not installed; only the stdlib codec is measured")
+
+    results: dict[str, dict[str, float]] = {}
+    for codec in codecs:
+        timings = {
+            "decode": min(timeit.repeat(lambda: codec.loads(body), number=1, repeat=args.repeat)),
+            "stream": min(
+                timeit.repeat(lambda: stream_decode(api, codec, body), number=1, repeat=args.repeat)
+            ),
+            "encode_100": min(
+                timeit.repeat(lambda: codec.dumps(commands), number=100, repeat=args.repeat)
+            )
+            / 100,
+        }
+        results[codec.name] = timings
+        print(
+            f"{codec.name:>7}: decode {timings['decode'] * 1000:8.1f} ms | "
+            f"stream+parse {timings['stream'] * 1000:8.1f} ms | "
+            f"encode 100 commands {timings['encode_100'] * 1e6:7.1f} µs"
+        )
+    if len(results) == 2:
+        base, fast = results["json"], results["orjson"]
+        print(
+            "speedup: "
+            + ", ".join(f"{name} {base[name] / fast[name]:.1f}x" for name in base)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare peak RSS of buffered and streaming Sync response decoding.
+
+Usage::
+
+    python benchmarks/bench_sync_decode.py [--items 50000]
+
+A synthetic full-sync payload is written to a temporary file and decoded in a
+fresh subprocess per mode, so each ``ru_maxrss`` reading only reflects that
+mode (the payload is generated in a subprocess too, because Linux carries the
+parent's peak RSS over into forked children). ``buffered`` mirrors the previous ``_request`` path (whole body, text,
+``json.loads``, typed objects and a ``raw`` dict copy); ``streaming`` feeds
+``SyncStreamDecoder`` in ``STREAM_CHUNK_SIZE`` chunks.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+SYNC_API = Path(__file__).resolve().parents[1] / "custom_components" / "todoist_sync" / "sync_api.py"
+
+
+def load_sync_api():
+    """Import sync_api.py without importing the Home Assistant integration package."""
+    spec = importlib.util.spec_from_file_location("todoist_sync_api", SYNC_API)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_payload(count: int) -> dict:
+    projects = [{"id": f"p{index}", "name": f"Project {index}", "order": index} for index in range(40)]
+    items = [
+        {
+            "id": str(6_000_000_000 + index),
+            "project_id": f"p{index % 40}",
+            "section_id": None,
+            "parent_id": str(6_000_000_000 + index - 1) if index % 5 else None,
+            "content": f"Chore number {index} with a reasonably descriptive title",
+            "description": "Some notes about the chore." if index % 3 else "",
+            "checked": index % 7 == 0,
+            "labels": ["home", "weekly"] if index % 2 else ["errands"],
+            "priority": 1 + index % 4,
+            "child_order": index,
+            "item_order": index,
+            "due": {
+                "date": f"2026-{1 + index % 12:02d}-{1 + index % 28:02d}",
+                "datetime": None,
+                "string": "every week",
+                "timezone": "Europe/London",
+                "is_recurring": True,
+                "lang": "en",
+            },
+            "added_at": "2026-01-01T10:00:00.000000Z",
+            "updated_at": "2026-01-02T10:00:00.000000Z",
+            "is_deleted": False,
+            "responsible_uid": None,
+        }
+        for index in range(count)
+    ]
+    return {
+        "sync_token": "x" * 40,
+        "full_sync": True,
+        "items": items,
+        "projects": projects,
+        "labels": [{"id": "l1", "name": "home", "item_order": 1}],
+        "temp_id_mapping": {},
+        "sync_status": {},
+    }
+
+
+def run_mode(mode: str, path: str) -> None:
+    api = load_sync_api()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    if mode == "buffered":
+        with open(path, "rb") as handle:
+            body = handle.read()
+        data = json.loads(body.decode())
+        tasks = [api.SyncTask.from_json(task) for task in data.get("items") or [] if task]
+        raw = dict(data)
+        count = len(tasks)
+        del body, data, raw
+    else:
+        decoder = api.SyncStreamDecoder()
+        with open(path, "rb") as handle:
+            while chunk := handle.read(api.STREAM_CHUNK_SIZE):
+                decoder.feed(chunk)
+        decoder.close()
+        count = len(decoder.resources["items"])
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"mode": mode, "tasks": count, "peak_delta_kib": peak - baseline, "seconds": elapsed}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--mode", choices=("generate", "buffered", "streaming"))
+    parser.add_argument("--payload")
+    args = parser.parse_args()
+
+    if args.mode == "generate":
+        Path(args.payload).write_text(json.dumps(build_payload(args.items)))
+        return
+    if args.mode:
+        run_mode(args.mode, args.payload)
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        path = handle.name
+    subprocess.run(
+        [sys.executable, __file__, "--mode", "generate", "--items", str(args.items), "--payload", path],
+        check=True,
+    )
+    size_mib = Path(path).stat().st_size / 2**20
+    print(f"payload: {args.items} items, {size_mib:.1f} MiB")
+    results = {}
+    try:
+        for mode in ("buffered", "streaming"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--payload", path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results[mode] = json.loads(output)
+            print(
+                f"{mode:>9}: peak RSS +{results[mode]['peak_delta_kib'] / 1024:.1f} MiB "
+                f"in {results[mode]['seconds']:.2f} s"
+            )
+    finally:
+        Path(path).unlink()
+    buffered = results["buffered"]["peak_delta_kib"]
+    streaming = results["streaming"]["peak_delta_kib"]
+    if buffered:
+        print(f"reduction: {100 * (buffered - streaming) / buffered:.0f}%")
+    if results["buffered"]["seconds"]:
+        slowdown = results["streaming"]["seconds"] / results["buffered"]["seconds"]
+        print(f" slowdown: {slowdown:.1f}x decode time when streaming")
+
+
+if __name__ == "__main__":
+    main()
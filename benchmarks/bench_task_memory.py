@@ -0,0 +1,103 @@
+"""Measure heap bytes per parsed ``SyncTask`` with and without value pooling.
+
+Usage::
+
+    python benchmarks/bench_task_memory.py [--items 40000]
+
+The synthetic payload from ``bench_sync_decode`` is decoded and parsed under
+``tracemalloc``, which then reports what the task objects retain once the
+decoded dicts are gone. ``unpooled`` swaps the module's ``ValuePool`` for a
+pass-through to reproduce the previous behaviour. Finally the pooled tasks are
+loaded into the default ``KeyedStore`` and into the compact
+``ColumnarTaskStore`` to compare what each backend keeps per task, sort
+entries and indexes included.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib
+import json
+import sys
+import tracemalloc
+import types
+
+from bench_sync_decode import SYNC_API, build_payload, load_sync_api
+
+
+def load_store_modules():
+    """Import store.py and columnar.py without running the package ``__init__``."""
+    package = types.ModuleType("todoist_sync_bench")
+    package.__path__ = [str(SYNC_API.parent)]
+    sys.modules[package.__name__] = package
+    return (
+        importlib.import_module(f"{package.__name__}.store"),
+        importlib.import_module(f"{package.__name__}.columnar"),
+    )
+
+
+def measure(api, body: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(body)["items"]
+    tasks = [api.SyncTask.from_json(item) for item in items]
+    del items
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return retained
+
+
+def measure_store(api, store_cls, body: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(body)["items"]
+    store = store_cls(
+        lambda task: (task.project_id or "", task.order or 0),
+        keep=lambda task: not task.is_deleted and not task.is_archived,
+    )
+    store.add_index(lambda task: task.project_id)
+    store.add_index(lambda task: task.parent_id)
+    store.reset(api.SyncTask.from_json(item) for item in items)
+    del items
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=40_000)
+    args = parser.parse_args()
+
+    api = load_sync_api()
+    pool = api._POOL
+    body = json.dumps(build_payload(args.items))
+    print(f"payload: {args.items} items")
+    results = {}
+    for mode in ("unpooled", "pooled"):
+        pool.clear()
+        api._POOL = pool if mode == "pooled" else (lambda value: value)
+        results[mode] = measure(api, body) / args.items
+    api._POOL = pool
+    print(
+        f"  parsed: unpooled {results['unpooled']:.0f} B/task, "
+        f"pooled {results['pooled']:.0f} B/task "
+        f"({100 * (1 - results['pooled'] / results['unpooled']):.0f}% less)"
+    )
+
+    store, columnar = load_store_modules()
+    api = sys.modules["todoist_sync_bench.sync_api"]
+    keyed = measure_store(api, store.KeyedStore, body) / args.items
+    compact = measure_store(api, columnar.ColumnarTaskStore, body) / args.items
+    print(
+        f"  stored: KeyedStore {keyed:.0f} B/task, ColumnarTaskStore {compact:.0f} B/task "
+        f"({100 * (1 - compact / keyed):.0f}% less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
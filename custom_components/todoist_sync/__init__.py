@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import logging
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_WEBHOOK_ID, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
-from .coordinator import TodoistDataUpdateCoordinator
+from .const import CONF_WEBHOOK, DOMAIN
+from .coordinator import TodoistDataUpdateCoordinator, snapshot_store
 from .services import async_register_services
+from .webhook import async_setup_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,19 +23,49 @@ PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.TODO, Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Todoist Sync from a config entry."""
 
+    if entry.options.get(CONF_WEBHOOK) and CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+
     coordinator = TodoistDataUpdateCoordinator(hass, _LOGGER, entry)
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(coordinator.async_shutdown)
+    # Entries are not unloaded when Home Assistant stops; write a pending snapshot.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, coordinator.async_flush_snapshot
+        )
+    )
+    warm_start = await coordinator.async_restore_snapshot()
+    if not warm_start:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if warm_start:
+        # Entities were created from the stored snapshot; catch up incrementally.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_warm_start_sync"
+        )
+
+    if entry.options.get(CONF_WEBHOOK):
+        async_setup_webhook(hass, entry, coordinator)
+
     async_register_services(hass)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -42,6 +74,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot when a config entry is deleted."""
+    await snapshot_store(hass, entry).async_remove()
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Todoist Sync component."""
     return True
@@ -5,13 +5,14 @@ import datetime
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import TodoistDataUpdateCoordinator
+from .entity import TodoistProjectEntity
 
 
 async def async_setup_entry(
@@ -28,9 +29,7 @@ async def async_setup_entry(
     )
 
 
-class TodoistCalendarEntity(
-    CoordinatorEntity[TodoistDataUpdateCoordinator], CalendarEntity
-):
+class TodoistCalendarEntity(TodoistProjectEntity, CalendarEntity):
     """A calendar entity for a Todoist project."""
 
     def __init__(
@@ -40,92 +39,82 @@ class TodoistCalendarEntity(
         project_name: str,
     ) -> None:
         """Initialize the Todoist calendar entity."""
-        super().__init__(coordinator=coordinator)
-        self._project_id = project_id
+        super().__init__(coordinator, project_id)
         self._attr_unique_id = f"{coordinator.entry.entry_id}-{project_id}"
         self._attr_name = project_name
         self._event: CalendarEvent | None = None
+        self._unsub_event_end: CALLBACK_TYPE | None = None
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
         return self._event
 
-    def _compute_event_window(
-        self, task
-    ) -> tuple[datetime.datetime, datetime.datetime] | None:
-        """Derive local start/end datetimes for a task's due information."""
-        due = task.due
-        if not due:
-            return None
-
-        due_datetime = getattr(due, "datetime", None)
-        if due_datetime:
-            if isinstance(due_datetime, datetime.datetime):
-                start = dt_util.as_local(due_datetime)
-            else:
-                parsed_datetime = dt_util.parse_datetime(due_datetime)
-                if parsed_datetime is None:
-                    return None
-                start = dt_util.as_local(parsed_datetime)
-            end = start + datetime.timedelta(hours=1)
-            return start, end
-
-        due_date = getattr(due, "date", None)
-        if due_date:
-            if isinstance(due_date, datetime.date):
-                parsed_date = due_date
-            else:
-                parsed_date = dt_util.parse_date(due_date)
-            if parsed_date is None:
-                return None
-            start = dt_util.start_of_local_day(parsed_date)
-            end = start + datetime.timedelta(days=1)
-            return start, end
-
-        return None
-
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime.datetime, end_date: datetime.datetime
     ) -> list[CalendarEvent]:
-        """Get all events in a specific time frame."""
-        events = []
-        for task in self.coordinator.data.tasks:
-            if task.project_id != self._project_id:
-                continue
-            window = self._compute_event_window(task)
-            if not window:
-                continue
-            start, end = window
-            if start_date < start < end_date:
-                event = CalendarEvent(
-                    summary=task.content,
-                    start=start,
-                    end=end,
-                    description=task.description,
-                    uid=task.id,
-                )
-                events.append(event)
-        return events
+        """Get all events overlapping a specific time frame."""
+        return [
+            CalendarEvent(
+                summary=task.content,
+                start=start,
+                end=end,
+                description=task.description,
+                uid=task.id,
+            )
+            for start, end, task in self.coordinator.events_between(
+                self._project_id, start_date, end_date
+            )
+        ]
+
+    async def async_added_to_hass(self) -> None:
+        """Pick the next event once the entity is added."""
+        await super().async_added_to_hass()
+        self._update_next_event()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending event-end timer."""
+        self._cancel_event_end()
+        await super().async_will_remove_from_hass()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update the entity."""
-        next_event = None
-        for task in self.coordinator.data.tasks:
-            if task.project_id != self._project_id:
-                continue
-            window = self._compute_event_window(task)
-            if not window:
-                continue
-            start, end = window
-            if not next_event or start < next_event.start:
-                next_event = CalendarEvent(
-                    summary=task.content,
-                    start=start,
-                    end=end,
-                    description=task.description,
-                    uid=task.id,
-                )
-        self._event = next_event
+        self._update_next_event()
         super()._handle_coordinator_update()
+
+    @callback
+    def _update_next_event(self) -> None:
+        """Take the current or next event from the coordinator's event index.
+
+        A timer at the event's end advances to the following event, so the
+        entity moves on without waiting for a sync.
+        """
+        self._cancel_event_end()
+        found = self.coordinator.next_event(self._project_id, dt_util.now())
+        if found is None:
+            self._event = None
+            return
+        start, end, task = found
+        self._event = CalendarEvent(
+            summary=task.content,
+            start=start,
+            end=end,
+            description=task.description,
+            uid=task.id,
+        )
+        self._unsub_event_end = async_track_point_in_utc_time(
+            self.hass, self._async_event_ended, end
+        )
+
+    @callback
+    def _async_event_ended(self, now: datetime.datetime) -> None:
+        self._unsub_event_end = None
+        self._update_next_event()
+        self.async_write_ha_state()
+
+    @callback
+    def _cancel_event_end(self) -> None:
+        if self._unsub_event_end is not None:
+            self._unsub_event_end()
+            self._unsub_event_end = None
@@ -0,0 +1,284 @@
+"""Column-oriented task storage for very large Todoist accounts."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping
+import copy
+from typing import Any
+
+from .store import KeyedStore
+from .sync_api import SyncDue, SyncTask
+
+# Bits of the per-row flag byte.
+_COMPLETED = 1
+_DELETED = 2
+_ARCHIVED = 4
+_HAS_ORDER = 8
+_HAS_PRIORITY = 16
+
+# Project code for "no project".
+_NONE = 0
+
+
+class TaskColumns(MutableMapping[str, "TaskRow"]):
+    """Id → task mapping that stores every task field in its own column.
+
+    Integers and flags live in ``array``/``bytearray`` columns, project ids are
+    dictionary-encoded, and strings, label tuples and due values are kept as
+    (pooled) references, so the row itself costs a handful of machine words
+    instead of a ``SyncTask`` object. The per-task strings stay separate
+    objects either way. Reads return lightweight ``TaskRow`` views; a view is
+    only valid until its row is removed or reused.
+    """
+
+    def __init__(self) -> None:
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+        self._ids: list[str | None] = []
+        self._contents: list[str] = []
+        self._descriptions: list[str | None] = []
+        self._parent_ids: list[str | None] = []
+        self._labels: list[tuple[str, ...]] = []
+        # Due values are immutable and shared between tasks, see ``SyncDue``.
+        self._dues: list[SyncDue | None] = []
+        self._project_codes = array("i")
+        self._orders = array("q")
+        self._priorities = array("b")
+        self._flags = bytearray()
+        # Project ids are dictionary-encoded; code 0 means "no project".
+        self._project_names: list[str | None] = [None]
+        self._project_lookup: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __getitem__(self, key: str) -> TaskRow:
+        return TaskRow(self, self._rows[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._rows.get(key)
+        if row is None:
+            return default
+        return TaskRow(self, row)
+
+    def __setitem__(self, key: str, task: Any) -> None:
+        row = self._rows.get(key)
+        if row is None:
+            row = self._allocate()
+            self._rows[key] = row
+        self._write(row, task)
+
+    def __delitem__(self, key: str) -> None:
+        self._release(self._rows.pop(key))
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Remove ``key`` and return a detached copy of its task."""
+
+        row = self._rows.pop(key, None)
+        if row is None:
+            return default
+        task = TaskRow(self, row).detach()
+        self._release(row)
+        return task
+
+    def clear(self) -> None:
+        self._reset_columns()
+
+    def copy(self) -> TaskColumns:
+        """Return a copy whose columns are independent of this container."""
+
+        clone = TaskColumns.__new__(TaskColumns)
+        for name, column in vars(self).items():
+            setattr(clone, name, copy.copy(column))
+        return clone
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        self._ids.append(None)
+        for column in (
+            self._contents,
+            self._descriptions,
+            self._parent_ids,
+            self._labels,
+            self._dues,
+        ):
+            column.append(None)  # type: ignore[arg-type]
+        self._project_codes.append(_NONE)
+        self._orders.append(0)
+        self._priorities.append(0)
+        self._flags.append(0)
+        return len(self._ids) - 1
+
+    def _release(self, row: int) -> None:
+        self._ids[row] = None
+        self._contents[row] = None  # type: ignore[call-overload]
+        self._descriptions[row] = None
+        self._parent_ids[row] = None
+        self._labels[row] = None  # type: ignore[call-overload]
+        self._dues[row] = None
+        self._project_codes[row] = _NONE
+        self._flags[row] = 0
+        self._free.append(row)
+
+    def _project_code(self, project_id: str | None) -> int:
+        if project_id is None:
+            return _NONE
+        code = self._project_lookup.get(project_id)
+        if code is None:
+            code = len(self._project_names)
+            self._project_names.append(project_id)
+            self._project_lookup[project_id] = code
+        return code
+
+    def _write(self, row: int, task: Any) -> None:
+        order = task.order
+        priority = task.priority
+        flags = 0
+        if task.is_completed:
+            flags |= _COMPLETED
+        if task.is_deleted:
+            flags |= _DELETED
+        if task.is_archived:
+            flags |= _ARCHIVED
+        if order is not None:
+            flags |= _HAS_ORDER
+        if priority is not None:
+            flags |= _HAS_PRIORITY
+        self._ids[row] = task.id
+        self._contents[row] = task.content
+        self._descriptions[row] = task.description
+        self._parent_ids[row] = task.parent_id
+        self._labels[row] = task.labels
+        self._dues[row] = task.due
+        self._project_codes[row] = self._project_code(task.project_id)
+        self._orders[row] = order or 0
+        self._priorities[row] = priority or 0
+        self._flags[row] = flags
+
+
+class TaskRow:
+    """Read-only view of one ``TaskColumns`` row with the ``SyncTask`` interface."""
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: TaskColumns, row: int) -> None:
+        self._columns = columns
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._columns._ids[self._row]  # type: ignore[return-value]
+
+    @property
+    def project_id(self) -> str | None:
+        columns = self._columns
+        return columns._project_names[columns._project_codes[self._row]]
+
+    @property
+    def content(self) -> str:
+        return self._columns._contents[self._row]
+
+    @property
+    def description(self) -> str | None:
+        return self._columns._descriptions[self._row]
+
+    @property
+    def is_completed(self) -> bool:
+        return bool(self._columns._flags[self._row] & _COMPLETED)
+
+    @property
+    def parent_id(self) -> str | None:
+        return self._columns._parent_ids[self._row]
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        return self._columns._labels[self._row]
+
+    @property
+    def priority(self) -> int | None:
+        columns = self._columns
+        if not columns._flags[self._row] & _HAS_PRIORITY:
+            return None
+        return columns._priorities[self._row]
+
+    @property
+    def order(self) -> int | None:
+        columns = self._columns
+        if not columns._flags[self._row] & _HAS_ORDER:
+            return None
+        return columns._orders[self._row]
+
+    @property
+    def due(self) -> SyncDue | None:
+        return self._columns._dues[self._row]
+
+    @property
+    def is_deleted(self) -> bool:
+        return bool(self._columns._flags[self._row] & _DELETED)
+
+    @property
+    def is_archived(self) -> bool:
+        return bool(self._columns._flags[self._row] & _ARCHIVED)
+
+    def detach(self) -> SyncTask:
+        """Copy the row into a standalone ``SyncTask``."""
+
+        return SyncTask(
+            id=self.id,
+            project_id=self.project_id,
+            content=self.content,
+            description=self.description,
+            is_completed=self.is_completed,
+            parent_id=self.parent_id,
+            labels=self.labels,
+            priority=self.priority,
+            order=self.order,
+            due=self.due,
+            is_deleted=self.is_deleted,
+            is_archived=self.is_archived,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.detach().to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskRow):
+            other = other.detach()
+        if not isinstance(other, SyncTask):
+            return NotImplemented
+        return self.detach() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TaskRow({self.detach()!r})"
+
+
+class ColumnarTaskStore(KeyedStore[Any]):
+    """``KeyedStore`` for tasks backed by ``TaskColumns`` instead of a dict."""
+
+    @property
+    def columns(self) -> TaskColumns:
+        """Return the column container holding the stored tasks."""
+
+        return self._items  # type: ignore[return-value]
+
+    def _new_items(self) -> TaskColumns:
+        return TaskColumns()
+
+    def frozen(self) -> Iterable[Any]:
+        # Rows are rewritten in place, so copy the columns instead of the views.
+        return self.columns.copy().values()
+
+    def _detached(self, item: Any) -> Any:
+        return item.detach() if isinstance(item, TaskRow) else item
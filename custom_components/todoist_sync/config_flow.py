@@ -15,7 +15,20 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_TOKEN
 from homeassistant.core import callback
 
-from .const import CONF_ADVANCED_MODE, CONF_INCLUDE_ARCHIVED, DOMAIN
+from .const import (
+    CONF_ADVANCED_MODE,
+    CONF_COMMAND_BATCHING,
+    CONF_COMPACT_TASK_STORE,
+    CONF_INCLUDE_ARCHIVED,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_RETAIN_RAW_RESPONSES,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_SECRET,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +97,44 @@ class TodoistOptionsFlowHandler(OptionsFlow):
                             CONF_ADVANCED_MODE, False
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_COMMAND_BATCHING,
+                        default=self.config_entry.options.get(
+                            CONF_COMMAND_BATCHING, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_RETAIN_RAW_RESPONSES,
+                        default=self.config_entry.options.get(
+                            CONF_RETAIN_RAW_RESPONSES, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COMPACT_TASK_STORE,
+                        default=self.config_entry.options.get(
+                            CONF_COMPACT_TASK_STORE, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_POLL_INTERVAL_MIN,
+                        default=self.config_entry.options.get(
+                            CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_POLL_INTERVAL_MAX,
+                        default=self.config_entry.options.get(
+                            CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_WEBHOOK,
+                        default=self.config_entry.options.get(CONF_WEBHOOK, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_WEBHOOK_SECRET,
+                        default=self.config_entry.options.get(CONF_WEBHOOK_SECRET, ""),
+                    ): str,
                 }
             ),
         )
@@ -8,6 +8,27 @@ CONF_PROJECT_LABEL_WHITELIST: Final = "labels"
 CONF_PROJECT_WHITELIST: Final = "include_projects"
 CONF_INCLUDE_ARCHIVED: Final = "include_archived"
 CONF_ADVANCED_MODE: Final = "advanced_mode"
+CONF_COMMAND_BATCHING: Final = "command_batching"
+CONF_RETAIN_RAW_RESPONSES: Final = "retain_raw_responses"
+CONF_COMPACT_TASK_STORE: Final = "compact_task_store"
+CONF_POLL_INTERVAL_MIN: Final = "poll_interval_min"
+CONF_POLL_INTERVAL_MAX: Final = "poll_interval_max"
+CONF_WEBHOOK: Final = "webhook"
+CONF_WEBHOOK_SECRET: Final = "webhook_secret"
+
+# Sync API: Seconds to collect commands before sending them as one batch
+COMMAND_BATCH_WINDOW: Final = 0.1
+# Coordinator: Seconds to merge repeated update/complete commands for one task
+TASK_COMMAND_COALESCE_WINDOW: Final = 0.25
+# Coordinator: Default bounds (seconds) of the adaptive polling interval
+DEFAULT_POLL_INTERVAL_MIN: Final = 30
+DEFAULT_POLL_INTERVAL_MAX: Final = 300
+# Coordinator: Below this unused share of the Sync quota, polling is stretched
+POLL_BUDGET_LOW: Final = 0.5
+# Coordinator: Longest interval (seconds) a low Sync quota can stretch polling to
+POLL_BUDGET_CEILING: Final = 3600
+# Webhook: Seconds to collect webhook events into a single delta sync
+WEBHOOK_DEBOUNCE: Final = 2.0
 
 # Calendar Platform: Does this calendar event last all day?
 ALL_DAY: Final = "all_day"
@@ -95,6 +116,14 @@ COLLABORATORS: Final = "collaborators"
 
 DOMAIN: Final = "todoist_sync"
 
+# Storage: Persisted coordinator snapshot used to warm-start after a restart
+STORAGE_KEY: Final = f"{DOMAIN}.snapshot"
+STORAGE_VERSION: Final = 1
+# Storage: Seconds to wait before flushing a changed snapshot to disk
+SNAPSHOT_SAVE_DELAY: Final = 10
+# Coordinator: Full syncs with at least this many tasks are merged in the executor
+EXECUTOR_TASK_THRESHOLD: Final = 2000
+
 SERVICE_NEW_TASK: Final = "new_task"
 SERVICE_UPDATE_TASK: Final = "update_task"
 SERVICE_GET_TASK: Final = "get_task"
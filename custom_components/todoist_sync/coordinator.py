@@ -1,23 +1,61 @@
 """DataUpdateCoordinator for the Todoist Sync component."""
 
-from datetime import date, datetime, timedelta
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
 import logging
 import time
 import uuid
-from typing import Any, Iterable, Sequence
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+)
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_TOKEN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    COMMAND_BATCH_WINDOW,
+    CONF_COMMAND_BATCHING,
+    CONF_COMPACT_TASK_STORE,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_RETAIN_RAW_RESPONSES,
+    CONF_WEBHOOK,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DOMAIN,
+    EXECUTOR_TASK_THRESHOLD,
+    POLL_BUDGET_CEILING,
+    POLL_BUDGET_LOW,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    TASK_COMMAND_COALESCE_WINDOW,
+    WEBHOOK_DEBOUNCE,
+)
 from .sync_api import (
+    SYNC_COMMAND_LIMIT,
     CommandResult,
+    RequestPriority,
     SyncDue,
+    SyncLabel,
+    SyncProject,
     SyncResponse,
     SyncTask,
     TodoistSyncAuthError,
@@ -27,19 +65,372 @@ from .sync_api import (
     TodoistSyncRequestError,
     TodoistSyncTokenReset,
 )
-from .types import TodoistData
+from .columnar import ColumnarTaskStore
+from .due import due_window
+from .item_diff import DUE_ARGS, encoded_size, minimal_item_update, prepare_item_args
+from .optimistic import OptimisticBatch
+from .store import Change, GroupIndex, IntervalIndex, KeyedStore, item_key
+from .types import BulkCommandResult, ProjectContext, TodoistChangeSet, TodoistData
+
+
+def _task_sort_key(task: Any) -> tuple[Any, ...]:
+    return (getattr(task, "project_id", "") or "", getattr(task, "order", 0) or 0)
+
+
+def _named_sort_key(resource: Any) -> tuple[Any, ...]:
+    return (getattr(resource, "order", 0) or 0, getattr(resource, "name", "") or "")
+
+
+def _task_event_window(task: Any) -> tuple[datetime, datetime] | None:
+    return due_window(getattr(task, "due", None))
+
+
+def _is_active(resource: Any) -> bool:
+    return not getattr(resource, "is_deleted", False) and not getattr(
+        resource, "is_archived", False
+    )
+
+
+def _is_live_label(label: Any) -> bool:
+    return not getattr(label, "is_deleted", False)
+
+
+def _record_changes(
+    changes: Iterable[Change[Any]],
+    added: set[str],
+    updated: set[str],
+    removed: set[str],
+) -> None:
+    for key, before, after in changes:
+        if after is None:
+            removed.add(key)
+        elif before is None:
+            added.add(key)
+        else:
+            updated.add(key)
+
+
+class _Stores(NamedTuple):
+    """Keyed stores and secondary indexes making up the coordinator state."""
+
+    tasks: KeyedStore[Any]
+    projects: KeyedStore[Any]
+    labels: KeyedStore[Any]
+    tasks_by_project: GroupIndex[Any]
+    children_by_parent: GroupIndex[Any]
+    events_by_project: IntervalIndex[Any]
+
+
+class _Applied(NamedTuple):
+    """Snapshot and change set produced by applying one Sync response."""
+
+    data: TodoistData
+    change_set: TodoistChangeSet
+
+
+def _create_stores(
+    tasks: Iterable[Any] = (),
+    projects: Iterable[Any] = (),
+    labels: Iterable[Any] = (),
+    compact: bool = False,
+) -> _Stores:
+    """Build a fresh set of stores; safe to call from an executor thread."""
+
+    task_store_cls = ColumnarTaskStore if compact else KeyedStore
+    task_store: KeyedStore[Any] = task_store_cls(_task_sort_key, keep=_is_active)
+    tasks_by_project = task_store.add_index(
+        lambda task: getattr(task, "project_id", None)
+    )
+    children_by_parent = task_store.add_index(
+        lambda task: getattr(task, "parent_id", None)
+    )
+    events_by_project = task_store.add_interval_index(
+        lambda task: getattr(task, "project_id", None), _task_event_window
+    )
+    task_store.reset(tasks)
+    project_store: KeyedStore[Any] = KeyedStore(_named_sort_key, keep=_is_active)
+    project_store.reset(projects)
+    label_store: KeyedStore[Any] = KeyedStore(_named_sort_key, keep=_is_live_label)
+    label_store.reset(labels)
+    return _Stores(
+        task_store,
+        project_store,
+        label_store,
+        tasks_by_project,
+        children_by_parent,
+        events_by_project,
+    )
+
+
+def _snapshot_payload(
+    sync_token: str,
+    last_update: float | None,
+    tasks: Iterable[Any],
+    projects: Iterable[Any],
+    labels: Iterable[Any],
+) -> dict[str, Any]:
+    """Serialize frozen store contents; safe to call from an executor thread."""
+
+    return {
+        "sync_token": sync_token,
+        "last_update": last_update,
+        "tasks": [task.to_dict() for task in tasks],
+        "projects": [project.to_dict() for project in projects],
+        "labels": [label.to_dict() for label in labels],
+    }
+
+
+def _restore_stores(stored: Mapping[str, Any], compact: bool) -> _Stores:
+    """Rebuild stores from a persisted snapshot payload."""
+
+    return _create_stores(
+        (SyncTask.from_dict(task) for task in stored.get("tasks") or []),
+        (SyncProject.from_dict(project) for project in stored.get("projects") or []),
+        (SyncLabel.from_dict(label) for label in stored.get("labels") or []),
+        compact,
+    )
+
+
+_T = TypeVar("_T")
+
+
+class _SingleFlight(Generic[_T]):
+    """Coalesce concurrent calls of an async function.
+
+    A call made while the function is idle starts a run right away. Calls made
+    while a run is in flight all join the single run queued behind it, since
+    the in-flight request may predate the change they are waiting for. Every
+    caller receives the result (or exception) of the run it joined.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, name: str, func: Callable[[], Awaitable[_T]]
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._func = func
+        self._queued: asyncio.Future[_T] | None = None
+        self._queued_callers = 0
+        self._driver: asyncio.Task[None] | None = None
+        self.requests = 0
+        self.runs = 0
+        self.absorbed = 0
+        self.max_absorbed = 0
+
+    async def __call__(self) -> _T:
+        self.requests += 1
+        if self._queued is None:
+            self._queued = self._hass.loop.create_future()
+            self._queued_callers = 0
+            if self._driver is None:
+                self._driver = self._hass.async_create_background_task(
+                    self._drive(), self._name
+                )
+        self._queued_callers += 1
+        return await asyncio.shield(self._queued)
+
+    async def _drive(self) -> None:
+        try:
+            while self._queued is not None:
+                future, callers = self._queued, self._queued_callers
+                self._queued = None
+                self.runs += 1
+                self.absorbed += callers - 1
+                self.max_absorbed = max(self.max_absorbed, callers - 1)
+                try:
+                    result = await self._func()
+                except Exception as err:  # noqa: BLE001 - handed to every caller
+                    future.set_exception(err)
+                except BaseException:
+                    # Cancelled (e.g. on shutdown): release the callers of this
+                    # run and of the one queued behind it instead of leaving
+                    # them waiting forever.
+                    future.cancel()
+                    if self._queued is not None:
+                        self._queued.cancel()
+                        self._queued = None
+                    raise
+                else:
+                    future.set_result(result)
+        finally:
+            self._driver = None
+
+    def diagnostics(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "runs": self.runs,
+            "absorbed": self.absorbed,
+            "max_absorbed": self.max_absorbed,
+        }
+
+
+class _PendingTaskCommands:
+    """Commands queued for one task during its coalescing window."""
+
+    __slots__ = ("original", "fields", "completed", "future", "flusher")
+
+    def __init__(self, original: Any | None, future: asyncio.Future[Any]) -> None:
+        self.original = original
+        self.fields: dict[str, Any] = {}
+        self.completed: bool | None = None
+        self.future = future
+        self.flusher: asyncio.Task[None] | None = None
+
+    def merge(self, command: Mapping[str, Any]) -> None:
+        command_type = command["type"]
+        if command_type == "item_complete":
+            self.completed = True
+        elif command_type == "item_uncomplete":
+            self.completed = False
+        else:
+            args = {key: value for key, value in command["args"].items() if key != "id"}
+            # A later due argument replaces whichever one an earlier command set.
+            if DUE_ARGS & args.keys():
+                for key in DUE_ARGS:
+                    self.fields.pop(key, None)
+            self.fields.update(args)
+
+    def net_commands(self, task_id: str) -> list[dict[str, Any]]:
+        """Return the commands with the combined effect of everything merged."""
+
+        commands: list[dict[str, Any]] = []
+        # Fields set and then reverted within the window cancel out as well.
+        args = minimal_item_update(self.original, {"id": task_id, **self.fields})
+        if len(args) > 1:
+            commands.append({"type": "item_update", "args": args})
+        was_completed = getattr(self.original, "is_completed", None)
+        if self.completed is not None and self.completed != was_completed:
+            commands.append({
+                "type": "item_complete" if self.completed else "item_uncomplete",
+                "args": {"id": task_id},
+            })
+        return commands
+
+
+class _TaskCommandQueue:
+    """Merge the update/complete/uncomplete commands queued for the same task.
+
+    The first command for a task opens a short window. Commands arriving within
+    it are merged: ``item_update`` fields are last-writer-wins, and completion
+    keeps only the final state, which is dropped when it matches the state the
+    task had before the window (a complete followed by an uncomplete cancels
+    out). When the window closes the net commands are sent and every caller
+    receives their ``CommandResult``, or ``None`` when nothing was left to send.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        window: float,
+        send: Callable[[list[dict[str, Any]], str, Any | None], Awaitable[CommandResult]],
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._window = window
+        self._send = send
+        self._pending: dict[str, _PendingTaskCommands] = {}
+        self.queued = 0
+        self.sent = 0
+        self.cancelled = 0
+        self.discarded = 0
+
+    async def submit(
+        self, task_id: str, commands: Iterable[Mapping[str, Any]], original: Any | None
+    ) -> CommandResult | None:
+        """Queue commands for ``task_id``; ``original`` is its state before them."""
+
+        pending = self._pending.get(task_id)
+        if pending is None:
+            pending = _PendingTaskCommands(original, self._hass.loop.create_future())
+            self._pending[task_id] = pending
+            pending.flusher = self._hass.async_create_background_task(
+                self._flush_later(task_id, pending), f"{self._name}_{task_id}"
+            )
+        for command in commands:
+            pending.merge(command)
+            self.queued += 1
+        return await asyncio.shield(pending.future)
+
+    def discard(self, task_ids: Iterable[str]) -> dict[str, Any | None]:
+        """Drop the queued commands of tasks about to be deleted.
+
+        Returns the pre-window state of every discarded task, so that a failed
+        delete can roll back to it.
+        """
+
+        originals: dict[str, Any | None] = {}
+        for task_id in task_ids:
+            pending = self._pending.pop(task_id, None)
+            if pending is None:
+                continue
+            if pending.flusher is not None:
+                pending.flusher.cancel()
+            pending.future.set_result(None)
+            originals[task_id] = pending.original
+            self.discarded += 1
+        return originals
 
+    async def async_flush(self, task_ids: Iterable[str] | None = None) -> None:
+        """Send queued commands now instead of waiting for their window.
 
-def _task_key(task: Any) -> str | None:
-    """Return the string key for a Todoist task-like object."""
+        Only the commands of ``task_ids`` are sent when it is given.
+        """
+
+        if task_ids is None:
+            queued = list(self._pending.items())
+        else:
+            queued = [
+                (task_id, self._pending[task_id])
+                for task_id in dict.fromkeys(task_ids)
+                if task_id in self._pending
+            ]
+        for task_id, pending in queued:
+            if pending.flusher is not None:
+                pending.flusher.cancel()
+            await self._flush(task_id, pending)
+
+    async def _flush_later(self, task_id: str, pending: _PendingTaskCommands) -> None:
+        await asyncio.sleep(self._window)
+        pending.flusher = None
+        await self._flush(task_id, pending)
+
+    async def _flush(self, task_id: str, pending: _PendingTaskCommands) -> None:
+        if self._pending.get(task_id) is not pending:
+            return
+        del self._pending[task_id]
+        commands = pending.net_commands(task_id)
+        if not commands:
+            self.cancelled += 1
+            pending.future.set_result(None)
+            return
+        self.sent += len(commands)
+        try:
+            result = await self._send(commands, task_id, pending.original)
+        except Exception as err:  # noqa: BLE001 - handed to every caller
+            pending.future.set_exception(err)
+        except BaseException:
+            # Cancelled mid-send: release the callers instead of leaving them
+            # waiting on a result that will never arrive.
+            pending.future.cancel()
+            raise
+        else:
+            pending.future.set_result(result)
+
+    def diagnostics(self) -> dict[str, int]:
+        return {
+            "pending_tasks": len(self._pending),
+            "queued": self.queued,
+            "sent": self.sent,
+            "cancelled": self.cancelled,
+            "discarded": self.discarded,
+        }
 
-    if task is None:
-        return None
 
-    identifier = getattr(task, "id", None) or getattr(task, "task_id", None)
-    if identifier is None:
-        return None
-    return str(identifier)
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the on-disk store holding the warm-start snapshot for an entry."""
+
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
 
 
 class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
@@ -52,25 +443,80 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
         entry: ConfigEntry,
     ) -> None:
         """Initialize the Todoist Sync coordinator."""
+        poll_min = entry.options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN)
+        poll_max = max(
+            poll_min, entry.options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX)
+        )
+        self._webhook_enabled = entry.options.get(CONF_WEBHOOK, False)
+        if self._webhook_enabled:
+            # Webhook deliveries trigger syncs; polling is only a slow safety net.
+            poll_min = poll_max
         super().__init__(
             hass,
             logger,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=poll_min),
+        )
+        self._poll_min = float(poll_min)
+        self._poll_max = float(poll_max)
+        self._idle_polls = 0
+        self._webhook_events: Counter[str] = Counter()
+        self._webhook_rejections: Counter[str] = Counter()
+        self._webhook_syncs = 0
+        self._update_diff_stats: Counter[str] = Counter()
+        self._task_refresh_flight: _SingleFlight[frozenset[str]] = _SingleFlight(
+            hass, f"{DOMAIN}_task_refresh", self._async_task_delta_refresh
+        )
+        self._full_refresh_flight: _SingleFlight[None] = _SingleFlight(
+            hass, f"{DOMAIN}_full_refresh", self.async_refresh
+        )
+        self._task_commands = _TaskCommandQueue(
+            hass,
+            f"{DOMAIN}_task_commands",
+            TASK_COMMAND_COALESCE_WINDOW,
+            self._send_task_commands,
+        )
+        self._webhook_debouncer = Debouncer(
+            hass,
+            logger,
+            cooldown=WEBHOOK_DEBOUNCE,
+            immediate=False,
+            function=self._async_webhook_sync,
         )
         self.entry = entry
         self._session = async_get_clientsession(hass)
         self._token = entry.data.get(CONF_TOKEN)
         if not self._token:
             raise HomeAssistantError("Todoist token missing from config entry")
-        self._task_lookup: dict[str, Any] = {}
+        self._compact_tasks = entry.options.get(CONF_COMPACT_TASK_STORE, False)
+        self._install_stores(_create_stores(compact=self._compact_tasks))
+        self._apply_lock = asyncio.Lock()
         self._sync_client = TodoistSyncClient(
             self._session,
             self._token,
             logger=logger,
+            batch_window=(
+                COMMAND_BATCH_WINDOW
+                if entry.options.get(CONF_COMMAND_BATCHING, False)
+                else None
+            ),
+            sync_token_provider=lambda: self._sync_token,
+            retain_raw=entry.options.get(CONF_RETAIN_RAW_RESPONSES, False),
         )
         self._sync_resources: tuple[str, ...] = ("items", "projects", "labels")
         self._sync_token: str = "*"
+        self._store = snapshot_store(hass, entry)
+        self._persisted_token: str | None = None
+        self._snapshot_last_update: float | None = None
+        self._unsub_snapshot_save: CALLBACK_TYPE | None = None
+        # A batched command response reaches every caller's hook; only the
+        # first one applies it, the others reuse its outcome.
+        self._last_applied: tuple[SyncResponse, _Applied] | None = None
+        self._change_set = TodoistChangeSet(full_sync=True)
+        self._listeners_saw_success: bool | None = None
+        self._revision = 0
+        self._full_sync_revision = 0
+        self._project_revisions: dict[str, int] = {}
 
     def _log_timing(self, operation: str, started: float, **context: Any) -> None:
         """Emit a timing message for coordinator operations."""
@@ -80,27 +526,134 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
         suffix = f" ({', '.join(extras)})" if extras else ""
         self.logger.info("[TodoistCoordinator] %s in %.2f ms%s", operation, elapsed, suffix)
 
-    def _rebuild_task_lookup(self, tasks: Iterable[Any]) -> None:
-        """Recreate the fast task lookup mapping."""
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the persisted snapshot so setup does not wait on a full sync.
+
+        Returns ``True`` when a usable snapshot was loaded. The next refresh then
+        continues incrementally from the stored sync token; if Todoist no longer
+        accepts it, ``_perform_sync`` falls back to a full sync.
+        """
+
+        started = time.perf_counter()
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        sync_token = stored.get("sync_token")
+        if not isinstance(sync_token, str) or sync_token == "*":
+            return False
+
+        try:
+            stores = await self.hass.async_add_executor_job(
+                _restore_stores, stored, self._compact_tasks
+            )
+        except (KeyError, TypeError, ValueError) as err:
+            self.logger.warning("Discarding unreadable Todoist snapshot: %s", err)
+            return False
+
+        self._install_stores(stores)
+        self._change_set = TodoistChangeSet(full_sync=True)
+        data = self._snapshot(stored.get("last_update") or dt_util.utcnow().timestamp())
+        self._sync_token = sync_token
+        self._persisted_token = sync_token
+        self.async_set_updated_data(data)
+        self._log_timing(
+            "async_restore_snapshot",
+            started,
+            tasks=len(data.tasks),
+            projects=len(data.projects),
+            labels=len(data.labels),
+            transport="storage",
+        )
+        return True
+
+    def _schedule_snapshot_save(self, data: TodoistData) -> None:
+        """Persist the snapshot and sync token after a short delay.
+
+        Changes within the delay are written together, from the state at the
+        time of the write. Nothing is scheduled when neither the stores nor the
+        token changed, so idle polls do not rewrite the file.
+        """
+
+        if self._change_set.is_empty and self._sync_token == self._persisted_token:
+            return
+        self._persisted_token = self._sync_token
+        self._snapshot_last_update = data.last_update
+        if self._unsub_snapshot_save is None:
+            self._unsub_snapshot_save = async_call_later(
+                self.hass, SNAPSHOT_SAVE_DELAY, self._async_save_snapshot
+            )
+
+    async def _async_save_snapshot(self, _now: datetime | None = None) -> None:
+        """Write the snapshot, serializing the tasks in the executor.
+
+        Only the frozen copies of the stores are taken on the event loop; token
+        and stores are captured together, before anything else can change them.
+        """
 
-        self._task_lookup = {}
-        for task in tasks:
-            key = _task_key(task)
-            if key is not None:
-                self._task_lookup[key] = task
+        self._unsub_snapshot_save = None
+        started = time.perf_counter()
+        payload = await self.hass.async_add_executor_job(
+            _snapshot_payload,
+            self._sync_token,
+            self._snapshot_last_update,
+            self._tasks.frozen(),
+            self._projects.frozen(),
+            self._labels.frozen(),
+        )
+        await self._store.async_save(payload)
+        self._log_timing("snapshot_save", started, tasks=len(payload["tasks"]))
+
+    async def async_flush_snapshot(self, _event: Event | None = None) -> None:
+        """Write a pending snapshot now instead of waiting for its delay."""
+
+        if self._unsub_snapshot_save is None:
+            return
+        self._unsub_snapshot_save()
+        await self._async_save_snapshot()
+
+    def _adapt_poll_interval(self, *, active: bool) -> None:
+        """Pick the next poll interval from recent activity and the rate budget.
+
+        Deltas and local commands drop the interval to the configured minimum;
+        every empty poll doubles it up to the maximum. When less than
+        ``POLL_BUDGET_LOW`` of the Sync quota is left, the result is stretched
+        further, past the maximum if need be but never beyond
+        ``POLL_BUDGET_CEILING``, so interactive commands keep their headroom.
+        Setting ``update_interval`` takes effect when the next refresh is
+        scheduled.
+        """
+
+        if active:
+            self._idle_polls = 0
+            interval = self._poll_min
+        else:
+            self._idle_polls += 1
+            interval = self._poll_min * 2 ** min(self._idle_polls, 16)
+        interval = max(self._poll_min, min(self._poll_max, interval))
+        remaining, blocked_for = self._sync_client.rate_budget()
+        if remaining < POLL_BUDGET_LOW:
+            interval = min(
+                interval * POLL_BUDGET_LOW / max(remaining, 0.05),
+                max(POLL_BUDGET_CEILING, self._poll_max),
+            )
+        interval = max(interval, blocked_for)
+        self.update_interval = timedelta(seconds=interval)
 
     async def _async_update_data(self) -> TodoistData:
         """Fetch data from the Todoist API via the Sync endpoint."""
         started = time.perf_counter()
         task_count = project_count = label_count = 0
         try:
-            response = await self._perform_sync()
-            data = self._apply_sync_response(response)
+            response, (data, change_set) = await self._perform_sync(
+                priority=RequestPriority.POLL
+            )
+            self._change_set = change_set
+            self._adapt_poll_interval(active=not self._change_set.is_empty)
             task_count = len(data.tasks)
             project_count = len(data.projects)
             label_count = len(data.labels)
-            self._sync_token = response.sync_token
-            self._rebuild_task_lookup(data.tasks)
+            self._schedule_snapshot_save(data)
             self._log_sync_response(response, task_count, project_count, label_count)
             return data
         except TodoistSyncRateLimitError as err:
@@ -126,7 +679,7 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
         """Add a task."""
         started = time.perf_counter()
         temp_id = uuid.uuid4().hex
-        args = self._prepare_item_args(data)
+        args = prepare_item_args(data)
         command_uuid = uuid.uuid4().hex
         command = {
             "type": "item_add",
@@ -145,7 +698,7 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
             refresh=refresh,
             transport="sync",
         )
-        return self._task_lookup.get(str(real_id)) if real_id else None
+        return self.get_cached_task(real_id) if real_id else None
 
     async def async_update_task(
         self,
@@ -162,7 +715,9 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
 
         started = time.perf_counter()
         payload = {key: value for key, value in data.items() if key != "task_id"}
-        update_args = self._prepare_item_args(payload, task_id=task_id)
+        update_args = self._minimal_update_args(
+            str(task_id), prepare_item_args(payload, task_id=task_id)
+        )
         body_without_id = {key: value for key, value in update_args.items() if key != "id"}
 
         commands: list[dict[str, Any]] = []
@@ -194,8 +749,7 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
             )
             return None
 
-        result = await self._execute_commands(commands, resource_types=("items",))
-        delta_tasks = sum(1 for task in result.sync.tasks if _task_key(task))
+        result = await self._queue_task_commands(task_id, commands)
         self._log_timing(
             "async_update_task",
             started,
@@ -204,7 +758,12 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
             reopen=reopen,
             updated=bool(body_without_id),
             command_count=len(commands),
-            delta_tasks=delta_tasks,
+            delta_tasks=(
+                sum(1 for task in result.sync.tasks if item_key(task))
+                if result is not None
+                else None
+            ),
+            coalesced=result is None,
             transport="sync",
         )
         return result
@@ -212,10 +771,10 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
     async def async_close_task(self, task_id: str, *, refresh: bool = True) -> bool:
         """Close a task."""
         started = time.perf_counter()
-        await self._execute_commands(({
+        await self._queue_task_commands(task_id, ({
             "type": "item_complete",
             "args": {"id": str(task_id)},
-        },), resource_types=("items",))
+        },))
         self._log_timing(
             "async_close_task",
             started,
@@ -228,10 +787,10 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
     async def async_reopen_task(self, task_id: str, *, refresh: bool = True) -> bool:
         """Reopen a task."""
         started = time.perf_counter()
-        await self._execute_commands(({
+        await self._queue_task_commands(task_id, ({
             "type": "item_uncomplete",
             "args": {"id": str(task_id)},
-        },), resource_types=("items",))
+        },))
         self._log_timing(
             "async_reopen_task",
             started,
@@ -244,10 +803,12 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
     async def async_delete_task(self, task_id: str, *, refresh: bool = True) -> bool:
         """Delete a task."""
         started = time.perf_counter()
+        # Updates still waiting in the coalescing window are moot now.
+        originals = self._task_commands.discard((str(task_id),))
         await self._execute_commands(({
             "type": "item_delete",
             "args": {"id": str(task_id)},
-        },), resource_types=("items",))
+        },), resource_types=("items",), originals=originals)
         self._log_timing(
             "async_delete_task",
             started,
@@ -257,140 +818,336 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
         )
         return True
 
+    async def _queue_task_commands(
+        self, task_id: str, commands: Sequence[dict[str, Any]]
+    ) -> CommandResult | None:
+        """Show commands for one task right away and send them coalesced.
+
+        Returns ``None`` when the commands cancelled out with others queued for
+        the same task, so nothing was sent.
+        """
+
+        task_id = str(task_id)
+        original = self.get_cached_task(task_id)
+        detach = getattr(original, "detach", None)
+        if detach is not None:
+            original = detach()
+        if self.data is not None:
+            batch = OptimisticBatch(commands, self.get_cached_task)
+            if batch:
+                self.async_set_updated_data(self._apply_local_tasks(batch.predicted()))
+        return await self._task_commands.submit(task_id, commands, original)
+
+    async def _send_task_commands(
+        self, commands: list[dict[str, Any]], task_id: str, original: Any | None
+    ) -> CommandResult:
+        """Send the net commands of a coalescing window."""
+
+        return await self._execute_commands(
+            commands, resource_types=("items",), originals={task_id: original}
+        )
+
     async def async_refresh_task(self, task_id: str) -> None:
-        """Fetch a single task and update local state."""
+        """Pull the latest task delta, falling back to a full refresh on a miss.
+
+        Concurrent callers share one delta sync (see ``_SingleFlight``), and
+        fallbacks share one full refresh.
+        """
         started = time.perf_counter()
         task_id_str = str(task_id)
+        reason: str | None = None
         try:
-            response = await self._perform_sync(resources=("items",))
-            data = self._apply_sync_response(response)
-            self._sync_token = response.sync_token
-            self._rebuild_task_lookup(data.tasks)
-            self.async_set_updated_data(data)
-            cache_hit = any(task.id == task_id_str for task in response.tasks)
-            self._log_timing(
-                "async_refresh_task",
-                started,
-                task_id=task_id,
-                cache_hit=cache_hit,
-                delta=len(response.tasks),
-                transport="sync-delta",
-            )
-            if not cache_hit and self.get_cached_task(task_id) is None:
-                fallback_started = time.perf_counter()
-                await self.async_refresh()
-                self._log_timing(
-                    "async_refresh_task_full",
-                    fallback_started,
-                    task_id=task_id,
-                    transport="sync-full",
-                )
+            delta_ids = await self._task_refresh_flight()
         except TodoistSyncRateLimitError as err:
             self.logger.warning(
                 "Todoist Sync rate limited while refreshing task %s: %s", task_id, err
             )
-            fallback_started = time.perf_counter()
-            await self.async_refresh()
-            self._log_timing(
-                "async_refresh_task_full",
-                fallback_started,
-                task_id=task_id,
-                transport="sync-full",
-                reason="rate_limited",
-            )
+            reason = "rate_limited"
         except TodoistSyncTokenReset:
             self.logger.warning(
                 "Todoist Sync token reset while refreshing task %s; forcing full sync", task_id
             )
             self._sync_token = "*"
-            fallback_started = time.perf_counter()
-            await self.async_refresh()
-            self._log_timing(
-                "async_refresh_task_full",
-                fallback_started,
-                task_id=task_id,
-                transport="sync-full",
-                reason="token_reset",
-            )
+            reason = "token_reset"
         except (TodoistSyncError, TodoistSyncRequestError, TodoistSyncAuthError) as err:
             self.logger.warning(
                 "Todoist Sync refresh failed for task %s (%s); falling back to full refresh",
                 task_id,
                 err,
             )
-            fallback_started = time.perf_counter()
-            await self.async_refresh()
+            reason = "error"
+        else:
+            cache_hit = task_id_str in delta_ids
             self._log_timing(
-                "async_refresh_task_full",
-                fallback_started,
+                "async_refresh_task",
+                started,
                 task_id=task_id,
-                transport="sync-full",
-                reason="error",
+                cache_hit=cache_hit,
+                delta=len(delta_ids),
+                transport="sync-delta",
             )
+            if cache_hit or self.get_cached_task(task_id) is not None:
+                return
+
+        fallback_started = time.perf_counter()
+        await self.async_request_full_refresh()
+        self._log_timing(
+            "async_refresh_task_full",
+            fallback_started,
+            task_id=task_id,
+            transport="sync-full",
+            reason=reason,
+        )
+
+    async def async_request_full_refresh(self) -> None:
+        """Run a full coordinator refresh, joining one that is already queued."""
+
+        await self._full_refresh_flight()
+
+    async def _async_task_delta_refresh(self) -> frozenset[str]:
+        """Apply the pending items delta and return the ids it contained."""
+
+        response, (data, change_set) = await self._perform_sync(
+            resources=("items",), priority=RequestPriority.REFRESH
+        )
+        self._change_set = change_set
+        if not self._change_set.is_empty:
+            self._adapt_poll_interval(active=True)
+        self.async_set_updated_data(data)
+        self._schedule_snapshot_save(data)
+        return frozenset(task.id for task in response.tasks)
 
     def get_cached_task(self, task_id: str) -> Any | None:
         """Return the cached Todoist task, if available."""
 
-        return self._task_lookup.get(str(task_id))
+        return self._tasks.get(str(task_id))
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return coordinator state for config entry diagnostics."""
+
+        return {
+            "sync_token_suffix": self._sync_token[-8:],
+            "revision": self._revision,
+            "tasks": len(self._tasks),
+            "projects": len(self._projects),
+            "labels": len(self._labels),
+            "compact_task_store": self._compact_tasks,
+            "poll_interval": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "idle_polls": self._idle_polls,
+            "refresh_coalescing": {
+                "task_refresh": self._task_refresh_flight.diagnostics(),
+                "full_refresh": self._full_refresh_flight.diagnostics(),
+            },
+            "command_coalescing": self._task_commands.diagnostics(),
+            "update_diff": dict(self._update_diff_stats),
+            "webhook": {
+                "enabled": self._webhook_enabled,
+                "events": dict(self._webhook_events),
+                "rejected": dict(self._webhook_rejections),
+                "syncs": self._webhook_syncs,
+            },
+            "rate_limit": self._sync_client.rate_limit_diagnostics(),
+            "scheduler": self._sync_client.scheduler_diagnostics(),
+            "raw_responses": self._sync_client.raw_response_diagnostics(),
+        }
+
+    @property
+    def change_set(self) -> TodoistChangeSet:
+        """Return the changes made by the most recently applied Sync response."""
+
+        return self._change_set
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, skipping project entities the last delta did not touch.
+
+        Listeners registered with a ``ProjectContext`` are only called when the
+        current change set affects that project, or when availability changed.
+        """
+
+        notify_all = (
+            not self.last_update_success
+            or self._listeners_saw_success != self.last_update_success
+        )
+        self._listeners_saw_success = self.last_update_success
+        change_set = self._change_set
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                notify_all
+                or not isinstance(context, ProjectContext)
+                or change_set.affects(context)
+            ):
+                update_callback()
+
+    @property
+    def tasks_by_project(self) -> GroupIndex[Any]:
+        """Return active tasks grouped by project id, in task order."""
+
+        return self._tasks_by_project
+
+    @property
+    def children_by_parent(self) -> GroupIndex[Any]:
+        """Return active subtasks grouped by parent task id, in task order."""
+
+        return self._children_by_parent
+
+    @property
+    def project_by_id(self) -> Mapping[str, Any]:
+        """Return active projects keyed by id."""
+
+        return self._projects.mapping
+
+    def events_between(
+        self, project_id: str, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime, Any]]:
+        """Return ``(start, end, task)`` for a project's events overlapping a range.
+
+        Answered from the interval index kept up to date with every delta.
+        """
+
+        return self._events_by_project.overlapping(project_id, start, end)
+
+    def next_event(
+        self, project_id: str, moment: datetime
+    ) -> tuple[datetime, datetime, Any] | None:
+        """Return ``(start, end, task)`` of a project's current or next event."""
+
+        return self._events_by_project.next_ending_after(project_id, moment)
+
+    async def async_handle_webhook_event(self, event_name: str) -> None:
+        """Schedule a debounced delta sync for a verified webhook delivery."""
+
+        self._webhook_events[event_name] += 1
+        await self._webhook_debouncer.async_call()
+
+    @callback
+    def record_webhook_rejection(self, reason: str) -> None:
+        """Count a webhook delivery that failed verification."""
+
+        self._webhook_rejections[reason] += 1
+        self.logger.debug("Rejected Todoist webhook delivery: %s", reason)
+
+    async def _async_webhook_sync(self) -> None:
+        """Pull the delta announced by one or more webhook deliveries."""
+
+        started = time.perf_counter()
+        try:
+            _, (data, change_set) = await self._perform_sync(
+                priority=RequestPriority.REFRESH
+            )
+        except (TodoistSyncError, TodoistSyncRequestError) as err:
+            # The safety-net poll will pick the change up later.
+            self.logger.warning("Todoist webhook sync failed: %s", err)
+            return
+        self._webhook_syncs += 1
+        self._change_set = change_set
+        self.async_set_updated_data(data)
+        self._schedule_snapshot_save(data)
+        self._log_timing(
+            "webhook_sync",
+            started,
+            tasks=len(data.tasks),
+            changed=not self._change_set.is_empty,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Send queued commands, write a pending snapshot and cancel pending syncs."""
+
+        await self._task_commands.async_flush()
+        await super().async_shutdown()
+        self._webhook_debouncer.async_shutdown()
+        await self.async_flush_snapshot()
 
     async def _perform_sync(
         self,
         resources: Iterable[str] | None = None,
         *,
         sync_token: str | None = None,
-    ) -> SyncResponse:
-        """Call the Sync API and handle token reset retries."""
+        priority: RequestPriority = RequestPriority.REFRESH,
+    ) -> tuple[SyncResponse, _Applied]:
+        """Call the Sync API, apply the response and handle token reset retries."""
 
-        token = (sync_token if sync_token is not None else self._sync_token) or "*"
+        # ``None`` lets the client read the coordinator token when the request is sent.
+        token = sync_token
         resource_types = tuple(resources or self._sync_resources)
+        applied: list[_Applied] = []
+        on_response = self._response_applier(applied)
         try:
-            return await self._sync_client.sync(resource_types, sync_token=token)
+            response = await self._sync_client.sync(
+                resource_types, sync_token=token, priority=priority, on_response=on_response
+            )
         except TodoistSyncTokenReset:
             self.logger.warning("Todoist Sync token reset requested; performing full sync")
             self._sync_token = "*"
-            return await self._sync_client.sync(resource_types, sync_token="*")
+            response = await self._sync_client.sync(
+                resource_types, sync_token="*", priority=priority, on_response=on_response
+            )
+        self._forget_applied(response)
+        return response, applied[-1]
+
+    def _response_applier(
+        self, applied: list[_Applied]
+    ) -> Callable[[SyncResponse], Awaitable[None]]:
+        """Return a client hook that applies a response and records the outcome.
+
+        The client awaits the hook before releasing the Sync endpoint, so the
+        next queued request reads the sync token this response produced.
+        """
+
+        async def _apply(response: SyncResponse) -> None:
+            applied.append(await self._async_apply_sync_response(response))
+
+        return _apply
+
+    def _forget_applied(self, response: SyncResponse) -> None:
+        """Drop the reference to ``response`` once every hook has seen it.
+
+        Batched callers' hooks all run before any of them gets its result, so
+        the first caller to return can release it; that keeps a large full
+        sync from being pinned until the next response.
+        """
+
+        if self._last_applied is not None and self._last_applied[0] is response:
+            self._last_applied = None
 
     async def _execute_commands(
         self,
         commands: Sequence[dict[str, Any]],
         *,
         resource_types: Iterable[str] | None = None,
+        originals: Mapping[str, Any | None] | None = None,
     ) -> CommandResult:
-        """Execute Sync commands and merge the resulting delta."""
+        """Execute Sync commands and merge the resulting delta.
+
+        ``originals`` overrides the cached state that a failed command rolls back
+        to, for tasks whose cached state already shows queued commands.
+        """
 
         if not commands:
             raise HomeAssistantError("No Todoist commands provided")
 
         resources = tuple(resource_types or self._sync_resources)
-        token = self._sync_token or "*"
         started = time.perf_counter()
+        commands = [
+            {**command, "uuid": command.get("uuid") or uuid.uuid4().hex}
+            for command in commands
+        ]
+        batch = self._apply_optimistic(commands, originals)
         try:
-            result = await self._sync_client.execute_commands(
-                list(commands),
-                sync_token=token,
-                resource_types=resources,
-            )
-        except TodoistSyncTokenReset:
-            self.logger.warning(
-                "Todoist Sync token reset during command execution; retrying with full sync"
-            )
-            self._sync_token = "*"
-            result = await self._sync_client.execute_commands(
-                list(commands),
-                sync_token="*",
-                resource_types=resources,
-            )
-        except TodoistSyncRateLimitError as err:
-            raise HomeAssistantError("Todoist Sync API rate limited") from err
-        except TodoistSyncAuthError as err:
-            raise HomeAssistantError("Todoist Sync API authentication failed") from err
-        except (TodoistSyncError, TodoistSyncRequestError) as err:
-            raise HomeAssistantError(f"Todoist command failed: {err}") from err
-
-        data = self._apply_sync_response(result.sync)
-        self._sync_token = result.sync.sync_token
-        self._rebuild_task_lookup(data.tasks)
+            result, (data, change_set) = await self._send_commands(commands, resources)
+        except HomeAssistantError:
+            if batch:
+                self.async_set_updated_data(self._apply_local_tasks(batch.rollback()))
+            raise
+
+        if batch:
+            data, change_set = self._reconcile_optimistic(batch, result, change_set)
+        self._change_set = change_set
+        self._adapt_poll_interval(active=True)
         self.async_set_updated_data(data)
+        self._schedule_snapshot_save(data)
         self._log_sync_response(
             result.sync,
             len(data.tasks),
@@ -416,165 +1173,378 @@ class TodoistDataUpdateCoordinator(DataUpdateCoordinator[TodoistData]):
 
         return result
 
-    def _prepare_item_args(self, payload: dict[str, Any], *, task_id: str | None = None) -> dict[str, Any]:
-        """Normalise task payload for Sync commands."""
+    async def _send_commands(
+        self,
+        commands: Sequence[dict[str, Any]],
+        resources: tuple[str, ...],
+    ) -> tuple[CommandResult, _Applied]:
+        """Send commands with the current sync token, retrying once on a token reset.
 
-        args: dict[str, Any] = {}
-        if task_id is not None:
-            args["id"] = str(task_id)
+        The response is applied before the Sync endpoint is released; the
+        result is returned together with the data it produced.
+        """
 
-        for key, value in payload.items():
-            if value is None:
-                continue
+        applied: list[_Applied] = []
+        on_response = self._response_applier(applied)
+        try:
+            result = await self._sync_client.execute_commands(
+                list(commands),
+                sync_token=None,
+                resource_types=resources,
+                on_response=on_response,
+            )
+        except TodoistSyncTokenReset:
+            self.logger.warning(
+                "Todoist Sync token reset during command execution; retrying with full sync"
+            )
+            self._sync_token = "*"
+            try:
+                result = await self._sync_client.execute_commands(
+                    list(commands),
+                    sync_token="*",
+                    resource_types=resources,
+                    on_response=on_response,
+                )
+            except TodoistSyncError as err:
+                raise HomeAssistantError(f"Todoist command failed: {err}") from err
+        except TodoistSyncRateLimitError as err:
+            raise HomeAssistantError("Todoist Sync API rate limited") from err
+        except TodoistSyncAuthError as err:
+            raise HomeAssistantError("Todoist Sync API authentication failed") from err
+        except (TodoistSyncError, TodoistSyncRequestError) as err:
+            raise HomeAssistantError(f"Todoist command failed: {err}") from err
+        self._forget_applied(result.sync)
+        return result, applied[-1]
 
-            if key in {"due_datetime", "due_date"}:
-                if isinstance(value, datetime):
-                    dt_value = value
-                    if dt_value.tzinfo is None:
-                        dt_value = dt_value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-                    dt_value = dt_util.as_utc(dt_value)
-                    args[key] = dt_value.isoformat().replace("+00:00", "Z")
-                elif isinstance(value, date):
-                    args[key] = value.isoformat()
-                else:
-                    args[key] = str(value)
-                continue
+    async def _execute_bulk(
+        self,
+        operation: str,
+        commands: Sequence[tuple[str, dict[str, Any]]],
+        originals: Mapping[str, Any | None] | None = None,
+    ) -> BulkCommandResult:
+        """Send per-task commands in ``SYNC_COMMAND_LIMIT`` chunks and publish once.
 
-            if key in {"project_id", "parent_id"}:
-                args[key] = str(value)
-                continue
+        Every chunk's delta is merged into the stores as it arrives, but listeners
+        are only notified once with the combined change set.
+        """
 
-            if key in {"labels", "label_ids"}:
-                iterable: Iterable[Any]
-                if isinstance(value, (list, tuple, set)):
-                    iterable = value
-                else:
-                    iterable = (value,)
-                normalised_labels = [
-                    str(label).strip()
-                    for label in iterable
-                    if label is not None and str(label).strip()
+        started = time.perf_counter()
+        outcome = BulkCommandResult()
+        if not commands:
+            return outcome
+
+        resources = ("items",)
+        change_set = TodoistChangeSet()
+        data: TodoistData | None = None
+        chunks = [
+            [
+                (task_id, {**command, "uuid": command.get("uuid") or uuid.uuid4().hex})
+                for task_id, command in commands[offset : offset + SYNC_COMMAND_LIMIT]
+            ]
+            for offset in range(0, len(commands), SYNC_COMMAND_LIMIT)
+        ]
+        # Every chunk is shown as applied up front; each is settled as it returns.
+        batches: list[OptimisticBatch | None] = [None] * len(chunks)
+        if self.data is not None:
+            batches = [
+                OptimisticBatch(
+                    (command for _, command in chunk), self._task_lookup(originals)
+                )
+                for chunk in chunks
+            ]
+            predicted = [
+                update for batch in batches if batch for update in batch.predicted()
+            ]
+            if predicted:
+                self.async_set_updated_data(self._apply_local_tasks(predicted))
+        for index, (chunk, batch) in enumerate(zip(chunks, batches)):
+            try:
+                result, (data, applied) = await self._send_commands(
+                    [command for _, command in chunk], resources
+                )
+            except HomeAssistantError as err:
+                # Earlier chunks were applied; roll back and report the rest.
+                rollback = [
+                    update
+                    for pending in batches[index:]
+                    if pending
+                    for update in pending.rollback()
                 ]
-                args["labels"] = normalised_labels
-                continue
+                if rollback:
+                    data = self._apply_local_tasks(rollback)
+                    change_set.merge(self._change_set)
+                for pending_chunk in chunks[index:]:
+                    for task_id, _ in pending_chunk:
+                        outcome.failed[task_id] = str(err)
+                break
+
+            if batch:
+                data, applied = self._reconcile_optimistic(batch, result, applied)
+            change_set.merge(applied)
+            errors = {
+                failure.command_uuid: str(failure.error or failure.error_code)
+                for failure in result.failed
+            }
+            for task_id, command in chunk:
+                if command["uuid"] in errors:
+                    outcome.failed[task_id] = errors[command["uuid"]]
+                else:
+                    outcome.succeeded.append(task_id)
 
-            if key == "priority":
-                try:
-                    args[key] = int(value)
-                except (TypeError, ValueError):
-                    continue
-                continue
+        if data is not None:
+            self._change_set = change_set
+            self._adapt_poll_interval(active=True)
+            self.async_set_updated_data(data)
+            self._schedule_snapshot_save(data)
 
-            args[key] = value
+        self._log_timing(
+            operation,
+            started,
+            count=len(commands),
+            succeeded=len(outcome.succeeded),
+            failed=len(outcome.failed),
+            requests=-(-len(commands) // SYNC_COMMAND_LIMIT),
+            transport="sync",
+        )
+        return outcome
 
-        return args
+    def _task_lookup(
+        self, originals: Mapping[str, Any | None] | None
+    ) -> Callable[[str], Any | None]:
+        """Return a task lookup preferring ``originals`` over the cache."""
 
-    def _apply_sync_response(self, response: SyncResponse) -> TodoistData:
-        """Merge the Sync response with the cached state."""
+        if not originals:
+            return self.get_cached_task
+        return lambda key: originals[key] if key in originals else self.get_cached_task(key)
 
-        if response.full_sync or self.data is None:
-            tasks = self._filter_tasks(response.tasks)
-            projects = self._filter_projects(response.projects)
-            labels = self._filter_labels(response.labels)
-        else:
-            tasks = self._merge_tasks(self.data.tasks, response.tasks)
-            projects = self._merge_projects(self.data.projects, response.projects)
-            labels = self._merge_labels(self.data.labels, response.labels)
+    def _apply_optimistic(
+        self,
+        commands: Sequence[dict[str, Any]],
+        originals: Mapping[str, Any | None] | None = None,
+    ) -> OptimisticBatch | None:
+        """Show the predicted effect of task commands before Todoist replies.
 
-        return TodoistData(
-            tasks=tasks,
-            projects=projects,
-            labels=labels,
-            last_update=dt_util.utcnow().timestamp(),
+        Returns the batch to settle later, or ``None`` when nothing was applied.
+        """
+
+        if self.data is None:
+            return None
+        batch = OptimisticBatch(commands, self._task_lookup(originals))
+        if not batch:
+            return None
+        started = time.perf_counter()
+        self.async_set_updated_data(self._apply_local_tasks(batch.predicted()))
+        self._log_timing("optimistic_apply", started, command_count=len(commands))
+        return batch
+
+    def _reconcile_optimistic(
+        self, batch: OptimisticBatch, result: CommandResult, applied: TodoistChangeSet
+    ) -> _Applied:
+        """Settle an optimistic batch against the command reply.
+
+        The reply's delta has already been applied, producing ``applied``; this
+        rolls back failed commands and swaps temporary ids for real ones. The
+        returned change set holds the changes of both steps.
+        """
+
+        change_set = TodoistChangeSet()
+        # ``applied`` may be shared with other callers of a batched request.
+        change_set.merge(applied)
+        data = self._apply_local_tasks(
+            batch.reconcile(
+                {failure.command_uuid for failure in result.failed},
+                result.temp_id_mapping,
+                result.sync.tasks,
+            )
         )
+        change_set.merge(self._change_set)
+        self._change_set = change_set
+        return _Applied(data, change_set)
+
+    def _apply_local_tasks(self, tasks: Sequence[Any]) -> TodoistData:
+        """Merge locally computed task states without advancing the sync token."""
 
-    def _filter_tasks(self, tasks: Iterable[Any]) -> list[Any]:
-        return sorted(
+        return self._apply_sync_response(
+            SyncResponse(
+                sync_token=self._sync_token,
+                full_sync=False,
+                tasks=list(tasks),
+                projects=[],
+                labels=[],
+            )
+        )
+
+    async def async_bulk_delete(self, task_ids: Iterable[str]) -> BulkCommandResult:
+        """Delete many tasks using as few Sync requests as possible."""
+
+        task_ids = [str(task_id) for task_id in task_ids]
+        return await self._execute_bulk(
+            "async_bulk_delete",
             [
-                task
-                for task in tasks
-                if not getattr(task, "is_deleted", False)
-                and not getattr(task, "is_archived", False)
+                (task_id, {"type": "item_delete", "args": {"id": task_id}})
+                for task_id in task_ids
             ],
-            key=lambda task: (
-                getattr(task, "project_id", "") or "",
-                getattr(task, "order", 0) or 0,
-                getattr(task, "id", ""),
-            ),
+            self._task_commands.discard(task_ids),
         )
 
-    def _merge_tasks(self, existing: Iterable[Any], updates: Iterable[Any]) -> list[Any]:
-        task_map: dict[str, Any] = {}
-        for task in existing:
-            key = _task_key(task)
-            if key is not None and not getattr(task, "is_deleted", False):
-                task_map[key] = task
-        for update in updates:
-            key = _task_key(update)
-            if key is None:
-                continue
-            if getattr(update, "is_deleted", False) or getattr(update, "is_archived", False):
-                task_map.pop(key, None)
-                continue
-            task_map[key] = update
-        return self._filter_tasks(task_map.values())
+    async def async_bulk_close(self, task_ids: Iterable[str]) -> BulkCommandResult:
+        """Complete many tasks using as few Sync requests as possible."""
 
-    def _filter_projects(self, projects: Iterable[Any]) -> list[Any]:
-        return sorted(
+        task_ids = [str(task_id) for task_id in task_ids]
+        # Queued edits go out first so they are neither lost nor sent after
+        # the bulk commands.
+        await self._task_commands.async_flush(task_ids)
+        return await self._execute_bulk(
+            "async_bulk_close",
             [
-                project
-                for project in projects
-                if not getattr(project, "is_deleted", False)
-                and not getattr(project, "is_archived", False)
+                (task_id, {"type": "item_complete", "args": {"id": task_id}})
+                for task_id in task_ids
             ],
-            key=lambda project: (
-                getattr(project, "order", 0) or 0,
-                getattr(project, "name", ""),
-            ),
         )
 
-    def _merge_projects(self, existing: Iterable[Any], updates: Iterable[Any]) -> list[Any]:
-        project_map: dict[str, Any] = {}
-        for project in existing:
-            key = _task_key(project) or getattr(project, "id", None)
-            if key is not None and not getattr(project, "is_deleted", False):
-                project_map[str(key)] = project
-        for update in updates:
-            key = _task_key(update) or getattr(update, "id", None)
-            if key is None:
-                continue
-            str_key = str(key)
-            if getattr(update, "is_deleted", False) or getattr(update, "is_archived", False):
-                project_map.pop(str_key, None)
-                continue
-            project_map[str_key] = update
-        return self._filter_projects(project_map.values())
-
-    def _filter_labels(self, labels: Iterable[Any]) -> list[Any]:
-        return sorted(
-            [label for label in labels if not getattr(label, "is_deleted", False)],
-            key=lambda label: (
-                getattr(label, "order", 0) or 0,
-                getattr(label, "name", ""),
-            ),
+    async def async_bulk_update(
+        self, updates: Mapping[str, dict[str, Any]]
+    ) -> BulkCommandResult:
+        """Apply ``item_update`` payloads to many tasks using as few requests as possible."""
+
+        # Queued edits go out first so they are neither lost nor sent after
+        # the bulk commands, and the diff below sees their outcome.
+        await self._task_commands.async_flush(str(task_id) for task_id in updates)
+        commands: list[tuple[str, dict[str, Any]]] = []
+        for task_id, payload in updates.items():
+            args = self._minimal_update_args(
+                str(task_id), prepare_item_args(payload, task_id=task_id)
+            )
+            if len(args) > 1:
+                commands.append((str(task_id), {"type": "item_update", "args": args}))
+        return await self._execute_bulk("async_bulk_update", commands)
+
+    def _minimal_update_args(self, task_id: str, args: dict[str, Any]) -> dict[str, Any]:
+        """Drop ``item_update`` fields that already match the cached task."""
+
+        minimal = minimal_item_update(self.get_cached_task(task_id), args)
+        if len(minimal) < len(args):
+            self._update_diff_stats["fields_dropped"] += len(args) - len(minimal)
+            if len(minimal) > 1:
+                saved = encoded_size(args) - encoded_size(minimal)
+            else:
+                self._update_diff_stats["commands_suppressed"] += 1
+                saved = encoded_size({"type": "item_update", "args": args})
+            self._update_diff_stats["bytes_saved"] += saved
+        return minimal
+
+    def _install_stores(self, stores: _Stores) -> None:
+        """Adopt a complete set of stores as the coordinator state."""
+
+        self._tasks = stores.tasks
+        self._projects = stores.projects
+        self._labels = stores.labels
+        self._tasks_by_project = stores.tasks_by_project
+        self._children_by_parent = stores.children_by_parent
+        self._events_by_project = stores.events_by_project
+
+    async def _async_apply_sync_response(self, response: SyncResponse) -> _Applied:
+        """Apply a Sync response and adopt its sync token, in arrival order.
+
+        Large full syncs are merged into fresh stores in the executor and only
+        swapped in on the event loop; everything else is merged inline. A
+        response that was just applied (a batch shared by several callers) is
+        not applied again; its outcome is returned instead.
+        """
+
+        async with self._apply_lock:
+            if self._last_applied is not None and self._last_applied[0] is response:
+                return self._last_applied[1]
+            full_sync = response.full_sync or self.data is None
+            if full_sync and len(response.tasks) >= EXECUTOR_TASK_THRESHOLD:
+                stores = await self.hass.async_add_executor_job(
+                    _create_stores,
+                    response.tasks,
+                    response.projects,
+                    response.labels,
+                    self._compact_tasks,
+                )
+                self._install_stores(stores)
+                self._change_set = TodoistChangeSet(full_sync=True)
+                data = self._snapshot(dt_util.utcnow().timestamp())
+            else:
+                data = self._apply_sync_response(response)
+            self._sync_token = response.sync_token
+            applied = _Applied(data, self._change_set)
+            self._last_applied = (response, applied)
+            return applied
+
+    def _apply_sync_response(self, response: SyncResponse) -> TodoistData:
+        """Merge the Sync response into the keyed stores."""
+
+        if response.full_sync or self.data is None:
+            self._tasks.reset(response.tasks)
+            self._projects.reset(response.projects)
+            self._labels.reset(response.labels)
+            change_set = TodoistChangeSet(full_sync=True)
+        else:
+            change_set = TodoistChangeSet()
+            task_changes = self._tasks.apply(response.tasks)
+            _record_changes(
+                task_changes,
+                change_set.added_tasks,
+                change_set.updated_tasks,
+                change_set.removed_tasks,
+            )
+            for _, before, after in task_changes:
+                # A moved task affects both its old and its new project.
+                for task in (before, after):
+                    project_id = getattr(task, "project_id", None)
+                    if project_id is not None:
+                        change_set.affected_projects.add(str(project_id))
+            project_changes = self._projects.apply(response.projects)
+            _record_changes(
+                project_changes,
+                change_set.added_projects,
+                change_set.updated_projects,
+                change_set.removed_projects,
+            )
+            change_set.affected_projects.update(key for key, _, _ in project_changes)
+            _record_changes(
+                self._labels.apply(response.labels),
+                change_set.added_labels,
+                change_set.updated_labels,
+                change_set.removed_labels,
+            )
+
+        self._change_set = change_set
+        return self._snapshot(dt_util.utcnow().timestamp())
+
+    def _snapshot(self, last_update: float) -> TodoistData:
+        """Return a snapshot whose collections are live views of the stores.
+
+        Every snapshot gets the next revision, which is also recorded for the
+        projects the current change set touched (or all of them after a full
+        sync), see ``project_revision``.
+        """
+
+        self._revision += 1
+        if self._change_set.full_sync:
+            self._full_sync_revision = self._revision
+            self._project_revisions.clear()
+        else:
+            for project_id in self._change_set.affected_projects:
+                self._project_revisions[project_id] = self._revision
+        return TodoistData(
+            tasks=self._tasks.view,
+            projects=self._projects.view,
+            labels=self._labels.view,
+            last_update=last_update,
+            revision=self._revision,
         )
 
-    def _merge_labels(self, existing: Iterable[Any], updates: Iterable[Any]) -> list[Any]:
-        label_map: dict[str, Any] = {}
-        for label in existing:
-            key = getattr(label, "id", None)
-            if key is not None and not getattr(label, "is_deleted", False):
-                label_map[str(key)] = label
-        for update in updates:
-            key = getattr(update, "id", None)
-            if key is None:
-                continue
-            str_key = str(key)
-            if getattr(update, "is_deleted", False):
-                label_map.pop(str_key, None)
-                continue
-            label_map[str_key] = update
-        return self._filter_labels(label_map.values())
+    def project_revision(self, project_id: str) -> int:
+        """Return the revision of the last snapshot that changed a project.
+
+        Values derived from a project's tasks stay valid while this is unchanged.
+        """
+
+        return max(self._full_sync_revision, self._project_revisions.get(project_id, 0))
 
     def _log_sync_response(
         self,
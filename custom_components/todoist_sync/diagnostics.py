@@ -0,0 +1,22 @@
+"""Diagnostics support for the Todoist Sync integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_WEBHOOK_SECRET, DOMAIN
+from .coordinator import TodoistDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TodoistDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "options": async_redact_data(entry.options, {CONF_WEBHOOK_SECRET}),
+        "coordinator": coordinator.diagnostics(),
+    }
@@ -0,0 +1,123 @@
+"""Memoized parsing of Todoist due dates into local event windows."""
+from __future__ import annotations
+
+import datetime
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+# Upper bound on cached due values; the cache starts over once it is reached.
+DUE_CACHE_SIZE = 8192
+
+
+class ResolvedDue(NamedTuple):
+    """A due date resolved to local, timezone-aware start and end datetimes."""
+
+    start: datetime.datetime
+    end: datetime.datetime
+    all_day: bool
+
+
+# (date, datetime, timezone, default time zone) -> resolved due, or None when
+# the value cannot be parsed.
+_CACHE: dict[tuple[Any, ...], ResolvedDue | None] = {}
+_MISSING: Any = object()
+
+
+@lru_cache(maxsize=64)
+def _time_zone(name: str) -> datetime.tzinfo | None:
+    return dt_util.get_time_zone(name)
+
+
+def _parse_datetime(raw: Any, timezone: str | None) -> datetime.datetime | None:
+    if isinstance(raw, datetime.datetime):
+        parsed: datetime.datetime | None = raw
+    else:
+        parsed = dt_util.parse_datetime(raw)
+        if parsed is None:
+            try:
+                parsed = datetime.datetime.fromisoformat(raw)
+            except (TypeError, ValueError):
+                return None
+    if parsed.tzinfo is None:
+        tzinfo = _time_zone(timezone) if timezone else None
+        parsed = parsed.replace(tzinfo=tzinfo or dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def _parse_date(raw: Any) -> datetime.date | None:
+    if isinstance(raw, datetime.date):
+        return raw
+    if not isinstance(raw, str):
+        return None
+    value = raw.split("T")[0]
+    parsed = dt_util.parse_date(value)
+    if parsed is not None:
+        return parsed
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _resolve(
+    raw_date: Any, raw_datetime: Any, timezone: str | None
+) -> ResolvedDue | None:
+    if not raw_datetime and isinstance(raw_date, str) and "T" in raw_date:
+        # The Sync API reports timed dues as a full timestamp in ``date``.
+        raw_datetime = raw_date
+    if raw_datetime:
+        parsed = _parse_datetime(raw_datetime, timezone)
+        if parsed is None:
+            return None
+        start = dt_util.as_local(parsed)
+        return ResolvedDue(start, start + datetime.timedelta(hours=1), False)
+    if raw_date:
+        parsed_date = _parse_date(raw_date)
+        if parsed_date is None:
+            return None
+        start = dt_util.start_of_local_day(parsed_date)
+        return ResolvedDue(start, start + datetime.timedelta(days=1), True)
+    return None
+
+
+def resolve_due(due: Any | None) -> ResolvedDue | None:
+    """Return the local window of a ``SyncDue``, parsing each value only once.
+
+    Results are keyed by the due's date, datetime and timezone plus Home
+    Assistant's configured time zone, so a changed default time zone never
+    serves stale local times.
+    """
+
+    if due is None:
+        return None
+    key = (due.date, due.datetime, due.timezone, dt_util.DEFAULT_TIME_ZONE)
+    resolved = _CACHE.get(key, _MISSING)
+    if resolved is _MISSING:
+        if len(_CACHE) >= DUE_CACHE_SIZE:
+            _CACHE.clear()
+        resolved = _CACHE[key] = _resolve(due.date, due.datetime, due.timezone)
+    return resolved
+
+
+def due_window(
+    due: Any | None,
+) -> tuple[datetime.datetime, datetime.datetime] | None:
+    """Return the local ``(start, end)`` of a ``SyncDue`` without memoizing it.
+
+    For indexes that visit every task on a full sync: going through
+    ``resolve_due`` would fill the shared cache with dues no entity renders.
+    """
+
+    if due is None or not (due.date or due.datetime):
+        return None
+    resolved = _resolve(due.date, due.datetime, due.timezone)
+    return (resolved.start, resolved.end) if resolved is not None else None
+
+
+def clear_due_cache() -> None:
+    """Forget every memoized due value."""
+
+    _CACHE.clear()
+    _time_zone.cache_clear()
@@ -0,0 +1,29 @@
+"""Base entity for the Todoist Sync integration."""
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import TodoistDataUpdateCoordinator
+from .types import ProjectContext
+
+
+class TodoistProjectEntity(CoordinatorEntity[TodoistDataUpdateCoordinator]):
+    """A coordinator entity bound to a single Todoist project.
+
+    The entity subscribes with a ``ProjectContext`` so the coordinator only calls
+    ``_handle_coordinator_update`` when a Sync delta touches this project.
+    """
+
+    def __init__(
+        self,
+        coordinator: TodoistDataUpdateCoordinator,
+        project_id: str,
+        *,
+        watch_labels: bool = False,
+    ) -> None:
+        """Initialize the project entity."""
+        super().__init__(
+            coordinator=coordinator,
+            context=ProjectContext(project_id, labels=watch_labels),
+        )
+        self._project_id = project_id
@@ -0,0 +1,165 @@
+"""Field-level diff of ``item_update`` arguments against a cached task."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+import json
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Arguments that together describe a due date. They are compared and sent as a
+# group, because Todoist derives the whole due object from whichever is given.
+DUE_ARGS = frozenset({"due_date", "due_datetime", "due_string", "due_lang"})
+
+# Todoist reports tasks without an explicit priority as priority 1.
+_DEFAULT_PRIORITY = 1
+
+
+def prepare_item_args(
+    payload: Mapping[str, Any], *, task_id: str | None = None
+) -> dict[str, Any]:
+    """Normalise a task payload into Sync ``item_add``/``item_update`` arguments."""
+
+    args: dict[str, Any] = {}
+    if task_id is not None:
+        args["id"] = str(task_id)
+
+    for key, value in payload.items():
+        if value is None:
+            continue
+
+        if key in {"due_datetime", "due_date"}:
+            if isinstance(value, datetime):
+                dt_value = value
+                if dt_value.tzinfo is None:
+                    dt_value = dt_value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+                dt_value = dt_util.as_utc(dt_value)
+                args[key] = dt_value.isoformat().replace("+00:00", "Z")
+            elif isinstance(value, date):
+                args[key] = value.isoformat()
+            else:
+                args[key] = str(value)
+            continue
+
+        if key in {"project_id", "parent_id"}:
+            args[key] = str(value)
+            continue
+
+        if key in {"labels", "label_ids"}:
+            iterable: Iterable[Any]
+            if isinstance(value, (list, tuple, set)):
+                iterable = value
+            else:
+                iterable = (value,)
+            normalised_labels = [
+                str(label).strip()
+                for label in iterable
+                if label is not None and str(label).strip()
+            ]
+            args["labels"] = normalised_labels
+            continue
+
+        if key == "priority":
+            try:
+                args[key] = int(value)
+            except (TypeError, ValueError):
+                continue
+            continue
+
+        args[key] = value
+
+    return args
+
+
+def _as_utc(value: Any, timezone: str | None = None) -> datetime | None:
+    """Parse a Todoist or Home Assistant datetime into an aware UTC datetime."""
+
+    if isinstance(value, datetime):
+        parsed: datetime | None = value
+    else:
+        parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        tzinfo = dt_util.get_time_zone(timezone) if timezone else None
+        parsed = parsed.replace(tzinfo=tzinfo or dt_util.DEFAULT_TIME_ZONE)
+    return dt_util.as_utc(parsed)
+
+
+def _due_timestamp(due: Any | None) -> str | None:
+    """Return the timestamp of a timed due date; all-day dues have none."""
+
+    if due is None:
+        return None
+    if due.datetime:
+        return due.datetime
+    if due.date and "T" in due.date:
+        return due.date
+    return None
+
+
+def _due_unchanged(task: Any, args: Mapping[str, Any]) -> bool:
+    """Return True when the due arguments describe the task's current due date."""
+
+    due = getattr(task, "due", None)
+    if "due_datetime" in args:
+        existing = _due_timestamp(due)
+        if not existing:
+            return False
+        desired = _as_utc(args["due_datetime"])
+        if desired is None or desired != _as_utc(existing, getattr(due, "timezone", None)):
+            return False
+    if "due_date" in args:
+        if due is None or _due_timestamp(due) or due.date != args["due_date"]:
+            return False
+    if "due_string" in args:
+        due_string = str(args["due_string"])
+        if due_string.strip().lower() == "no date":
+            if due is not None:
+                return False
+        elif due is None or getattr(due, "string", None) != due_string:
+            return False
+    return True
+
+
+def _field_unchanged(task: Any, key: str, value: Any) -> bool:
+    if key in {"content", "project_id", "parent_id"}:
+        return getattr(task, key, None) == value
+    if key == "description":
+        return (getattr(task, "description", None) or "") == value
+    if key == "labels":
+        return set(getattr(task, "labels", None) or ()) == set(value)
+    if key == "priority":
+        return (getattr(task, "priority", None) or _DEFAULT_PRIORITY) == value
+    # Arguments the task does not mirror (sections, assignees...) always count.
+    return False
+
+
+def minimal_item_update(task: Any | None, args: Mapping[str, Any]) -> dict[str, Any]:
+    """Return ``args`` without the fields that already match ``task``.
+
+    ``args`` are normalised ``item_update`` arguments (see
+    ``prepare_item_args``). The ``id`` argument is always kept, so a result
+    holding nothing else means no command is needed. Without a cached task
+    every argument is kept.
+    """
+
+    if task is None:
+        return dict(args)
+    minimal: dict[str, Any] = {}
+    due_args = {key: value for key, value in args.items() if key in DUE_ARGS}
+    for key, value in args.items():
+        if key == "id":
+            minimal[key] = value
+        elif key not in DUE_ARGS and not _field_unchanged(task, key, value):
+            minimal[key] = value
+    if due_args and not _due_unchanged(task, due_args):
+        minimal.update(due_args)
+    return minimal
+
+
+def encoded_size(args: Mapping[str, Any]) -> int:
+    """Return the size of ``args`` as encoded in a Sync request body."""
+
+    return len(json.dumps(args, separators=(",", ":"), default=str))
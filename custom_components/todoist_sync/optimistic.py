@@ -0,0 +1,191 @@
+"""Local prediction of Sync task commands for optimistic updates."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable, Mapping
+from typing import Any
+
+from .store import item_key
+from .sync_api import SyncDue, SyncTask
+
+# Command types whose effect on a task can be predicted locally.
+OPTIMISTIC_COMMANDS = frozenset(
+    {"item_add", "item_update", "item_complete", "item_uncomplete", "item_delete"}
+)
+
+_TASK_FIELDS = (
+    "id",
+    "project_id",
+    "content",
+    "description",
+    "is_completed",
+    "parent_id",
+    "labels",
+    "priority",
+    "order",
+    "due",
+    "is_deleted",
+    "is_archived",
+)
+
+
+def evolve_task(task: Any, **changes: Any) -> SyncTask:
+    """Return a standalone ``SyncTask`` copy of ``task`` with ``changes`` applied."""
+
+    fields = {name: getattr(task, name, None) for name in _TASK_FIELDS}
+    fields.update(changes)
+    fields["content"] = fields["content"] or ""
+    fields["labels"] = tuple(fields["labels"] or ())
+    fields["is_completed"] = bool(fields["is_completed"])
+    fields["is_deleted"] = bool(fields["is_deleted"])
+    fields["is_archived"] = bool(fields["is_archived"])
+    return SyncTask(**fields)
+
+
+def _tombstone(key: str, like: Any | None) -> SyncTask:
+    """Return a deleted marker that makes ``KeyedStore.apply`` drop ``key``."""
+
+    return evolve_task(like, id=key, is_deleted=True)
+
+
+def _predicted_due(args: Mapping[str, Any], current: SyncDue | None) -> SyncDue | None:
+    if due_datetime := args.get("due_datetime"):
+        return SyncDue(date=str(due_datetime)[:10], datetime=str(due_datetime))
+    if due_date := args.get("due_date"):
+        return SyncDue(date=str(due_date), is_recurring=False)
+    if (due_string := args.get("due_string")) is not None:
+        if str(due_string).strip().lower() == "no date":
+            return None
+    # Natural-language strings are parsed by Todoist; the reply corrects them.
+    return current
+
+
+def _item_fields(args: Mapping[str, Any], task: Any | None) -> dict[str, Any]:
+    fields: dict[str, Any] = {}
+    for name in ("content", "description", "project_id", "parent_id"):
+        if name in args:
+            fields[name] = args[name]
+    if "labels" in args:
+        fields["labels"] = tuple(args["labels"])
+    if "priority" in args:
+        fields["priority"] = args["priority"]
+    if {"due_date", "due_datetime", "due_string"} & args.keys():
+        fields["due"] = _predicted_due(args, getattr(task, "due", None))
+    return fields
+
+
+def command_target(command: Mapping[str, Any]) -> str | None:
+    """Return the store key of the task a command acts on."""
+
+    if command.get("type") == "item_add":
+        return command.get("temp_id")
+    task_id = (command.get("args") or {}).get("id")
+    return str(task_id) if task_id is not None else None
+
+
+def predict(task: Any | None, command: Mapping[str, Any]) -> Any | None:
+    """Return the task state after ``command``; ``None`` means it no longer exists."""
+
+    command_type = command.get("type")
+    args = command.get("args") or {}
+    if command_type == "item_add":
+        return evolve_task(None, id=command["temp_id"], **_item_fields(args, None))
+    if task is None:
+        return None
+    if command_type == "item_delete":
+        return None
+    if command_type == "item_complete":
+        return evolve_task(task, is_completed=True)
+    if command_type == "item_uncomplete":
+        return evolve_task(task, is_completed=False)
+    if command_type == "item_update":
+        return evolve_task(task, **_item_fields(args, task))
+    return task
+
+
+class OptimisticBatch:
+    """Original state and queued commands for every task a batch touches.
+
+    The predicted state of a task is always recomputed from its original state
+    by replaying its commands in order, so a failed command can be rolled back
+    on its own while the commands that succeeded keep their effect.
+    """
+
+    def __init__(
+        self,
+        commands: Iterable[Mapping[str, Any]],
+        lookup: Callable[[str], Any | None],
+    ) -> None:
+        self._before: dict[str, Any | None] = {}
+        self._commands: dict[str, list[Mapping[str, Any]]] = {}
+        self._added: set[str] = set()
+        for command in commands:
+            if command.get("type") not in OPTIMISTIC_COMMANDS:
+                continue
+            key = command_target(command)
+            if key is None:
+                continue
+            if key not in self._before:
+                before = lookup(key)
+                detach = getattr(before, "detach", None)
+                self._before[key] = detach() if detach is not None else before
+            if command.get("type") == "item_add":
+                self._added.add(key)
+            self._commands.setdefault(key, []).append(command)
+
+    def __bool__(self) -> bool:
+        return bool(self._commands)
+
+    def _replay(self, key: str, failed: Collection[str] = ()) -> Any | None:
+        state = self._before[key]
+        for command in self._commands[key]:
+            if command.get("uuid") not in failed:
+                state = predict(state, command)
+        return state
+
+    def _update_for(self, key: str, state: Any | None) -> Any | None:
+        if state is not None:
+            return state
+        like = self._before[key]
+        return _tombstone(key, like) if like is not None or key in self._added else None
+
+    def predicted(self) -> list[Any]:
+        """Return the store updates that show every command as applied."""
+
+        updates = (self._update_for(key, self._replay(key)) for key in self._commands)
+        return [update for update in updates if update is not None]
+
+    def rollback(self) -> list[Any]:
+        """Return the store updates restoring every touched task."""
+
+        updates = (self._update_for(key, self._before[key]) for key in self._commands)
+        return [update for update in updates if update is not None]
+
+    def reconcile(
+        self,
+        failed: Collection[str],
+        temp_id_mapping: Mapping[str, str],
+        delta: Iterable[Any],
+    ) -> list[Any]:
+        """Return the store updates that settle the batch once Todoist replied.
+
+        Tasks present in the reply's delta already hold the server state. Others
+        are replayed without the failed commands, and temporary ids of added
+        tasks are replaced by their real ids.
+        """
+
+        delta_ids = {item_key(task) for task in delta}
+        updates: list[Any] = []
+        for key in self._commands:
+            if key in self._added:
+                updates.append(_tombstone(key, None))
+                real_id = temp_id_mapping.get(key)
+                state = self._replay(key, failed)
+                if real_id and real_id not in delta_ids and state is not None:
+                    updates.append(evolve_task(state, id=real_id))
+                continue
+            if key in delta_ids:
+                continue
+            update = self._update_for(key, self._replay(key, failed))
+            if update is not None:
+                updates.append(update)
+        return updates
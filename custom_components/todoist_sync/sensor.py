@@ -5,10 +5,10 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import TodoistDataUpdateCoordinator
+from .entity import TodoistProjectEntity
 
 
 async def async_setup_entry(
@@ -25,9 +25,7 @@ async def async_setup_entry(
     )
 
 
-class TodoistProjectSensor(
-    CoordinatorEntity[TodoistDataUpdateCoordinator], SensorEntity
-):
+class TodoistProjectSensor(TodoistProjectEntity, SensorEntity):
     """A sensor for a Todoist project."""
 
     def __init__(
@@ -37,8 +35,7 @@ class TodoistProjectSensor(
         project_name: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator=coordinator)
-        self._project_id = project_id
+        super().__init__(coordinator, project_id, watch_labels=True)
         self._attr_unique_id = f"{coordinator.entry.entry_id}-{project_id}-sensor"
         self._attr_name = project_name
         self._update_attrs()
@@ -58,8 +55,7 @@ class TodoistProjectSensor(
         if self.coordinator.data:
             tasks = [
                 task.to_dict()
-                for task in self.coordinator.data.tasks
-                if task.project_id == self._project_id
+                for task in self.coordinator.tasks_by_project.get(self._project_id)
             ]
 
             labels = [
@@ -69,14 +65,7 @@ class TodoistProjectSensor(
             ]
             label_lookup = {item["id"]: item["name"] for item in labels}
 
-            project = next(
-                (
-                    project
-                    for project in self.coordinator.data.projects
-                    if project.id == self._project_id
-                ),
-                None,
-            )
+            project = self.coordinator.project_by_id.get(self._project_id)
             if project is not None:
                 project_payload = (
                     project.to_dict()
@@ -43,7 +43,7 @@ def async_register_services(hass: HomeAssistant) -> None:
         _LOGGER.info("[Service] %s invoked", SERVICE_UPDATE_TASK)
         coordinator: TodoistDataUpdateCoordinator = next(iter(hass.data[DOMAIN].values()))
         task_id = call.data["task_id"]
-        if not any(task.id == task_id for task in coordinator.data.tasks):
+        if coordinator.get_cached_task(task_id) is None:
             raise HomeAssistantError(f"Task with id '{task_id}' not found.")
         payload = {key: value for key, value in call.data.items() if key != "task_id"}
         await coordinator.async_update_task(task_id, payload)
@@ -60,7 +60,7 @@ def async_register_services(hass: HomeAssistant) -> None:
         _LOGGER.info("[Service] %s invoked", SERVICE_GET_TASK)
         coordinator: TodoistDataUpdateCoordinator = next(iter(hass.data[DOMAIN].values()))
         task_id = call.data["task_id"]
-        task = next((task for task in coordinator.data.tasks if task.id == task_id), None)
+        task = coordinator.get_cached_task(task_id)
         if not task:
             raise HomeAssistantError(f"Task with id '{task_id}' not found.")
         hass.bus.async_fire(
@@ -0,0 +1,424 @@
+"""Keyed, incrementally sorted collections backing the coordinator snapshot."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+SortKey = tuple[Any, ...]
+Change = tuple[str, T | None, T | None]
+Window = tuple[datetime, datetime]
+
+
+def item_key(item: Any) -> str | None:
+    """Return the string key for a Todoist resource-like object."""
+
+    if item is None:
+        return None
+
+    identifier = getattr(item, "id", None) or getattr(item, "task_id", None)
+    if identifier is None:
+        return None
+    return str(identifier)
+
+
+class KeyedStore(Generic[T]):
+    """Id map plus a sorted key list, both maintained in place.
+
+    Each entry in the ordered list is ``sort_key(item) + (item_id,)`` so that
+    applying a delta only touches the changed entries: a dict update and a
+    ``bisect`` insert/remove, i.e. O(delta · log n) instead of a full rebuild.
+    """
+
+    def __init__(
+        self,
+        sort_key: Callable[[T], SortKey],
+        *,
+        keep: Callable[[T], bool],
+    ) -> None:
+        self._sort_key = sort_key
+        self._keep = keep
+        self._items: MutableMapping[str, T] = self._new_items()
+        self._entries: dict[str, SortKey] = {}
+        self._ordered: list[SortKey] = []
+        self._indexes: list[GroupIndex[T] | IntervalIndex[T]] = []
+        self._view: StoreView[T] = StoreView(self)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    @property
+    def view(self) -> StoreView[T]:
+        """Return a live, ordered read-only view of the stored items."""
+
+        return self._view
+
+    @property
+    def mapping(self) -> Mapping[str, T]:
+        """Return a live, read-only id → item mapping."""
+
+        return MappingProxyType(self._items)
+
+    def get(self, key: str) -> T | None:
+        """Return the item stored under ``key``."""
+
+        return self._items.get(key)
+
+    def frozen(self) -> Iterable[T]:
+        """Return the stored items, unordered, detached from later changes.
+
+        Items are replaced rather than mutated, so a copy of the references is
+        enough; the result can be read from an executor thread.
+        """
+
+        return list(self._items.values())
+
+    def add_index(self, group: Callable[[T], str | None]) -> GroupIndex[T]:
+        """Create a secondary index that is maintained alongside the store."""
+
+        index: GroupIndex[T] = GroupIndex(self, group)
+        self._attach(index)
+        return index
+
+    def add_interval_index(
+        self,
+        group: Callable[[T], str | None],
+        window: Callable[[T], Window | None],
+    ) -> IntervalIndex[T]:
+        """Create a per-group interval index maintained alongside the store."""
+
+        index: IntervalIndex[T] = IntervalIndex(self, group, window)
+        self._attach(index)
+        return index
+
+    def _attach(self, index: GroupIndex[T] | IntervalIndex[T]) -> None:
+        for entry in self._ordered:
+            index.add(entry[-1], entry, self._items[entry[-1]])
+        self._indexes.append(index)
+
+    def reset(self, items: Iterable[T]) -> None:
+        """Replace the contents with ``items`` (used for full syncs)."""
+
+        self._items = self._new_items()
+        self._entries = {}
+        for item in items:
+            key = item_key(item)
+            if key is None or not self._keep(item):
+                continue
+            self._items[key] = item
+            self._entries[key] = (*self._sort_key(item), key)
+        self._ordered = sorted(self._entries.values())
+        for index in self._indexes:
+            index.clear()
+            for entry in self._ordered:
+                index.add(entry[-1], entry, self._items[entry[-1]])
+
+    def apply(self, updates: Iterable[T]) -> list[Change[T]]:
+        """Merge a Sync delta, dropping items that are no longer active.
+
+        Returns a ``(key, before, after)`` tuple for every item whose stored
+        value actually changed; ``after`` is ``None`` for removals.
+        """
+
+        changes: list[Change[T]] = []
+        for update in updates:
+            key = item_key(update)
+            if key is None:
+                continue
+            before = self._items.get(key)
+            if self._keep(update):
+                if before == update:
+                    continue
+                if before is not None:
+                    before = self._detached(before)
+                self.upsert(key, update)
+                changes.append((key, before, update))
+            elif before is not None:
+                changes.append((key, self.remove(key), None))
+        return changes
+
+    def upsert(self, key: str, item: T) -> None:
+        """Insert or replace a single item, repositioning it if its order changed."""
+
+        entry = (*self._sort_key(item), key)
+        previous = self._entries.get(key)
+        self._items[key] = item
+        for index in self._indexes:
+            index.move(key, previous, entry, item)
+        if previous == entry:
+            return
+        if previous is not None:
+            self._discard_entry(previous)
+        self._entries[key] = entry
+        insort(self._ordered, entry)
+
+    def remove(self, key: str) -> T | None:
+        """Remove and return the item stored under ``key``."""
+
+        item = self._items.pop(key, None)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._discard_entry(entry)
+            for index in self._indexes:
+                index.discard(key, entry)
+        return item
+
+    def _new_items(self) -> MutableMapping[str, T]:
+        """Return the empty id → item container (overridden by compact stores)."""
+
+        return {}
+
+    def _detached(self, item: T) -> T:
+        """Return ``item`` in a form that survives later writes to the store."""
+
+        return item
+
+    def _discard_entry(self, entry: SortKey) -> None:
+        _discard_sorted(self._ordered, entry)
+
+    def _item_at(self, index: int) -> T:
+        return self._items[self._ordered[index][-1]]
+
+    def _iter_items(self) -> Iterator[T]:
+        items = self._items
+        for entry in self._ordered:
+            yield items[entry[-1]]
+
+
+class GroupIndex(Mapping[str, Sequence[T]], Generic[T]):
+    """Secondary index mapping a group value to its items in store order.
+
+    Each group keeps its own sorted entry list, so moving an item between
+    groups costs two ``bisect`` operations on the affected groups only.
+    """
+
+    def __init__(self, store: KeyedStore[T], group: Callable[[T], str | None]) -> None:
+        self._store = store
+        self._group = group
+        self._groups: dict[str, list[SortKey]] = {}
+        self._membership: dict[str, str] = {}
+
+    def __getitem__(self, group: str) -> Sequence[T]:
+        entries = self._groups[group]
+        return _EntryView(self._store, entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def get(self, group: str, default: Any = ()) -> Sequence[T]:  # type: ignore[override]
+        """Return the items in ``group`` (an empty sequence when it is unknown)."""
+
+        if group not in self._groups:
+            return default
+        return self[group]
+
+    def clear(self) -> None:
+        self._groups = {}
+        self._membership = {}
+
+    def add(self, key: str, entry: SortKey, item: T) -> None:
+        group = self._group(item)
+        if group is None:
+            return
+        self._membership[key] = group
+        insort(self._groups.setdefault(group, []), entry)
+
+    def discard(self, key: str, entry: SortKey) -> None:
+        group = self._membership.pop(key, None)
+        if group is None:
+            return
+        entries = self._groups.get(group)
+        if entries is None:
+            return
+        _discard_sorted(entries, entry)
+        if not entries:
+            del self._groups[group]
+
+    def move(self, key: str, previous: SortKey | None, entry: SortKey, item: T) -> None:
+        if previous == entry and self._membership.get(key) == self._group(item):
+            return
+        if previous is not None:
+            self.discard(key, previous)
+        self.add(key, entry, item)
+
+
+class IntervalIndex(Generic[T]):
+    """Per-group index of item time windows, sorted by window start.
+
+    Each group keeps a sorted ``(start, key)`` list plus the longest window it
+    has held. Items overlapping a range can therefore only start between
+    ``range_start - longest`` and ``range_end``, which two ``bisect`` calls
+    locate: a query costs O(log n + k) and a changed item O(log n).
+    """
+
+    def __init__(
+        self,
+        store: KeyedStore[T],
+        group: Callable[[T], str | None],
+        window: Callable[[T], Window | None],
+    ) -> None:
+        self._store = store
+        self._group = group
+        self._window = window
+        self.clear()
+
+    def clear(self) -> None:
+        self._starts: dict[str, list[tuple[datetime, str]]] = {}
+        self._longest: dict[str, timedelta] = {}
+        self._windows: dict[str, tuple[str, datetime, datetime]] = {}
+
+    def add(self, key: str, entry: SortKey, item: T) -> None:
+        group = self._group(item)
+        window = self._window(item) if group is not None else None
+        if group is None or window is None:
+            return
+        self._insert(key, (group, *window))
+
+    def discard(self, key: str, entry: SortKey) -> None:
+        placed = self._windows.pop(key, None)
+        if placed is None:
+            return
+        group, start, _ = placed
+        starts = self._starts[group]
+        index = bisect_left(starts, (start, key))
+        if index < len(starts) and starts[index] == (start, key):
+            del starts[index]
+        if not starts:
+            del self._starts[group]
+            del self._longest[group]
+
+    def move(self, key: str, previous: SortKey | None, entry: SortKey, item: T) -> None:
+        group = self._group(item)
+        window = self._window(item) if group is not None else None
+        placed = (group, *window) if group is not None and window is not None else None
+        if placed == self._windows.get(key):
+            return
+        self.discard(key, entry)
+        if placed is not None:
+            self._insert(key, placed)  # type: ignore[arg-type]
+
+    def _insert(self, key: str, placed: tuple[str, datetime, datetime]) -> None:
+        group, start, end = placed
+        self._windows[key] = placed
+        insort(self._starts.setdefault(group, []), (start, key))
+        span = end - start
+        if span > self._longest.get(group, timedelta(0)):
+            self._longest[group] = span
+
+    def overlapping(
+        self, group: str, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime, T]]:
+        """Return ``(start, end, item)`` for windows overlapping ``[start, end)``."""
+
+        starts = self._starts.get(group)
+        if not starts:
+            return []
+        low = bisect_left(starts, (start - self._longest[group],))
+        high = bisect_left(starts, (end,))
+        items = self._store._items
+        windows = self._windows
+        found: list[tuple[datetime, datetime, T]] = []
+        for _, key in starts[low:high]:
+            _, item_start, item_end = windows[key]
+            if item_end > start:
+                found.append((item_start, item_end, items[key]))
+        return found
+
+    def next_ending_after(
+        self, group: str, moment: datetime
+    ) -> tuple[datetime, datetime, T] | None:
+        """Return the earliest-starting window of ``group`` still open at ``moment``.
+
+        That is the window in progress at ``moment`` or else the next one to
+        start; windows that ended at or before ``moment`` are skipped.
+        """
+
+        starts = self._starts.get(group)
+        if not starts:
+            return None
+        windows = self._windows
+        for index in range(bisect_left(starts, (moment - self._longest[group],)), len(starts)):
+            key = starts[index][1]
+            _, start, end = windows[key]
+            if end > moment:
+                return start, end, self._store._items[key]
+        return None
+
+
+class _EntryView(Sequence[T]):
+    """Read-only sequence resolving sorted entries against a store."""
+
+    __slots__ = ("_store", "_entries")
+
+    def __init__(self, store: KeyedStore[T], entries: list[SortKey]) -> None:
+        self._store = store
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        items = self._store._items
+        if isinstance(index, slice):
+            return [items[entry[-1]] for entry in self._entries[index]]
+        return items[self._entries[index][-1]]
+
+    def __iter__(self) -> Iterator[T]:
+        items = self._store._items
+        for entry in self._entries:
+            yield items[entry[-1]]
+
+
+def _discard_sorted(entries: list[SortKey], entry: SortKey) -> None:
+    index = bisect_left(entries, entry)
+    if index < len(entries) and entries[index] == entry:
+        del entries[index]
+
+
+class StoreView(Sequence[T]):
+    """Read-only sequence over a ``KeyedStore`` in sort order."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: KeyedStore[T]) -> None:
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._store._item_at(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("store index out of range")
+        return self._store._item_at(index)
+
+    def __iter__(self) -> Iterator[T]:
+        return self._store._iter_items()
+
+    def __repr__(self) -> str:
+        return f"StoreView(len={len(self)})"
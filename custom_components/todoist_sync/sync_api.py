@@ -2,18 +2,88 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import heapq
+import itertools
 import json
 import logging
+import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, MutableMapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterable, Mapping, MutableMapping, Sequence, TypeVar
 
 from aiohttp import ClientError, ClientSession
 
+try:  # orjson ships with Home Assistant but is not required by this module.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 # See https://developer.todoist.com/api/v1/#tag/Sync
 SYNC_BASE_URL = "https://api.todoist.com/api/v1/sync"
+# Maximum number of commands Todoist accepts in a single Sync request.
+SYNC_COMMAND_LIMIT = 100
+# Size of the chunks read from the response body by the streaming decoder.
+STREAM_CHUNK_SIZE = 64 * 1024
+# Response bodies larger than this are decoded in the executor, not on the loop.
+EXECUTOR_THRESHOLD_BYTES = 256 * 1024
+# Default byte budget for raw response bodies retained for debugging.
+RAW_RESPONSE_BUDGET = 2 * 1024 * 1024
+# Per-user Sync quotas: (requests, period in seconds).
+SYNC_PARTIAL_QUOTA = (1000, 15 * 60)
+SYNC_FULL_QUOTA = (100, 15 * 60)
+# Maximum number of distinct values kept by the shared value pool.
+VALUE_POOL_SIZE = 16384
 _LOGGER = logging.getLogger(__name__)
 
+# Applies a response to the caller's state while the endpoint is still held.
+ResponseHook = Callable[["SyncResponse"], Awaitable[None]]
+
+
+class JsonCodec:
+    """Standard library JSON codec used for Sync request and response bodies."""
+
+    name = "json"
+    # Whether ``loads`` is fast enough to be worth batching array elements.
+    fast = False
+
+    @staticmethod
+    def loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec, used automatically when orjson is installed."""
+
+    name = "orjson"
+    fast = True
+
+    @staticmethod
+    def loads(data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+def select_codec(name: str | None = None) -> JsonCodec:
+    """Return the requested codec, or the fastest available one."""
+
+    if name == JsonCodec.name or (name is None and orjson is None):
+        return JsonCodec()
+    if orjson is None:
+        raise ValueError(f"JSON codec {name!r} is not available")
+    return OrjsonCodec()
+
 
 class TodoistSyncError(Exception):
     """Base exception for Sync API failures."""
@@ -39,9 +109,264 @@ class TodoistSyncRequestError(TodoistSyncError):
     """Raised for transport level issues after retries are exhausted."""
 
 
+class RequestPriority(IntEnum):
+    """Scheduling class of a Sync request; lower values are more urgent."""
+
+    INTERACTIVE = 0
+    REFRESH = 1
+    POLL = 2
+
+
+# Share of each quota that lower priority classes must leave untouched.
+_PRIORITY_RESERVE = {
+    RequestPriority.INTERACTIVE: 0.0,
+    RequestPriority.REFRESH: 0.05,
+    RequestPriority.POLL: 0.2,
+}
+
+
+class TokenBucket:
+    """Continuously refilling token bucket approximating a rolling quota."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """Return the tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def delay_for(self, cost: float, reserve: float = 0.0) -> float:
+        """Return seconds until ``cost`` can be taken while keeping ``reserve`` tokens."""
+        self._refill()
+        missing = cost + reserve * self.capacity - self._tokens
+        return max(0.0, missing / self.rate)
+
+    def consume(self, cost: float) -> None:
+        self._refill()
+        self._tokens -= cost
+
+    def drain(self) -> None:
+        """Empty the bucket after the server reported the quota as exhausted."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+
+class SyncRateLimiter:
+    """Client-side limiter keeping Sync traffic below Todoist's per-user quotas.
+
+    Full syncs draw from both the full and partial buckets. Background polls
+    must leave a reserve in each bucket so interactive commands can still get
+    through when the budget is low.
+    """
+
+    def __init__(self) -> None:
+        self._partial = TokenBucket(*SYNC_PARTIAL_QUOTA)
+        self._full = TokenBucket(*SYNC_FULL_QUOTA)
+        self._blocked_until = 0.0
+        self._throttled: dict[RequestPriority, int] = dict.fromkeys(RequestPriority, 0)
+        self._rate_limited = 0
+
+    async def acquire(self, priority: RequestPriority, *, full_sync: bool) -> float:
+        """Wait until the request fits the budget and take its tokens.
+
+        Returns the number of seconds spent waiting.
+        """
+
+        waited = 0.0
+        reserve = _PRIORITY_RESERVE[priority]
+        while True:
+            delay = max(
+                self._blocked_until - time.monotonic(),
+                self._partial.delay_for(1, reserve),
+                self._full.delay_for(1, reserve) if full_sync else 0.0,
+            )
+            if delay <= 0:
+                break
+            if not waited:
+                self._throttled[priority] += 1
+            await asyncio.sleep(delay)
+            waited += delay
+        self._partial.consume(1)
+        if full_sync:
+            self._full.consume(1)
+        return waited
+
+    def penalize(self, retry_after: float | None) -> None:
+        """Record an HTTP 429 so every class backs off until ``retry_after``."""
+
+        self._rate_limited += 1
+        self._partial.drain()
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def budget(self) -> tuple[float, float]:
+        """Return the unused share of the partial quota and seconds left blocked."""
+        return (
+            self._partial.available / self._partial.capacity,
+            max(0.0, self._blocked_until - time.monotonic()),
+        )
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the current budget for diagnostics."""
+
+        return {
+            "partial_sync_remaining": round(self._partial.available, 1),
+            "partial_sync_capacity": int(self._partial.capacity),
+            "full_sync_remaining": round(self._full.available, 1),
+            "full_sync_capacity": int(self._full.capacity),
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+            "throttled": {
+                priority.name.lower(): count for priority, count in self._throttled.items()
+            },
+            "rate_limited": self._rate_limited,
+        }
+
+
 @dataclass(slots=True)
+class _QueueStats:
+    """Wait-time and queue-depth counters for one priority class."""
+
+    depth: int = 0
+    max_depth: int = 0
+    granted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "granted": self.granted,
+            "avg_wait_ms": round(self.total_wait / self.granted * 1000, 2) if self.granted else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class SyncRequestScheduler:
+    """Grants exclusive use of the Sync endpoint in priority order.
+
+    Only one request is in flight at a time, so responses are still produced
+    and applied in server order. Waiters are served by ``RequestPriority`` and
+    then FIFO within a class, so an interactive command queued behind a
+    background poll is sent first.
+    """
+
+    def __init__(self) -> None:
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._stats = {priority: _QueueStats() for priority in RequestPriority}
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold the endpoint for the duration of the ``async with`` block."""
+
+        stats = self._stats[priority]
+        started = time.monotonic()
+        if self._busy or self._waiters:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            stats.depth += 1
+            stats.max_depth = max(stats.max_depth, stats.depth)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Granted just before the cancellation landed; pass it on.
+                    self._release()
+                raise
+            finally:
+                stats.depth -= 1
+        else:
+            self._busy = True
+
+        waited = time.monotonic() - started
+        stats.granted += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return per-class queue depth and wait-time metrics."""
+
+        return {priority.name.lower(): stats.as_dict() for priority, stats in self._stats.items()}
+
+
+_H = TypeVar("_H", bound=Hashable)
+
+
+class ValuePool:
+    """Hand out one shared object per distinct value.
+
+    Task payloads repeat the same project ids, parent ids, label sets and
+    timezones thousands of times, and every decoded copy is a separate object.
+    Passing them through the pool makes equal values share a single instance.
+    The pool is bounded: once ``max_size`` distinct values have been seen it
+    starts over, so values already handed out stay shared and memory stays flat.
+    """
+
+    __slots__ = ("_max_size", "_values")
+
+    def __init__(self, max_size: int = VALUE_POOL_SIZE) -> None:
+        self._max_size = max_size
+        self._values: dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __call__(self, value: _H) -> _H:
+        values = self._values
+        shared = values.get(value)
+        if shared is None:
+            if len(values) >= self._max_size:
+                values.clear()
+            values[value] = shared = value
+        return shared
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+# Shared by every parser in this module (including executor-thread decoding).
+_POOL = ValuePool()
+
+
+def _pool_optional(value: _H | None) -> _H | None:
+    return _POOL(value) if value is not None else None
+
+
+def _pooled_id(value: Any) -> str | None:
+    return _POOL(str(value)) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
 class SyncDue:
-    """Represents the due struct returned by the Sync API."""
+    """Represents the due struct returned by the Sync API.
+
+    Instances are immutable, so decoding hands out one shared instance per
+    distinct due value (recurring tasks often share theirs).
+    """
 
     date: str | None = None
     datetime: str | None = None
@@ -53,12 +378,14 @@ class SyncDue:
     def from_json(cls, data: Mapping[str, Any] | None) -> SyncDue | None:
         if not data:
             return None
-        return cls(
-            date=data.get("date"),
-            datetime=data.get("datetime"),
-            string=data.get("string"),
-            timezone=data.get("timezone"),
-            is_recurring=data.get("is_recurring"),
+        return _POOL(
+            cls(
+                date=_pool_optional(data.get("date")),
+                datetime=data.get("datetime"),
+                string=_pool_optional(data.get("string")),
+                timezone=_pool_optional(data.get("timezone")),
+                is_recurring=data.get("is_recurring"),
+            )
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -75,6 +402,22 @@ class SyncDue:
         }
 
 
+def _normalize_labels(labels_raw: Any) -> tuple[str, ...]:
+    if not labels_raw:
+        return ()
+    return _POOL(
+        tuple(
+            _POOL(str(value).strip())
+            for value in labels_raw
+            if value is not None and str(value).strip()
+        )
+    )
+
+
+def _optional_int(value: Any) -> int | None:
+    return int(value) if value is not None else None
+
+
 @dataclass(slots=True)
 class SyncTask:
     """Todoist task payload returned via Sync (items)."""
@@ -94,30 +437,36 @@ class SyncTask:
 
     @classmethod
     def from_json(cls, data: Mapping[str, Any]) -> SyncTask:
-        due = SyncDue.from_json(data.get("due"))
-        labels_raw = data.get("labels") or []
-        if not labels_raw:
+        return cls(
+            id=str(data["id"]),
+            project_id=_pooled_id(data.get("project_id")),
+            content=data.get("content") or "",
+            description=data.get("description"),
+            is_completed=bool(data.get("completed")) or bool(data.get("checked")),
+            parent_id=_pooled_id(data.get("parent_id")),
             # Older payloads may expose only label_ids; use them as-is if names are absent.
-            labels_raw = data.get("label_ids") or []
-        labels: tuple[str, ...] = tuple(
-            str(value).strip()
-            for value in labels_raw
-            if value is not None and str(value).strip()
+            labels=_normalize_labels(data.get("labels") or data.get("label_ids")),
+            priority=_optional_int(data.get("priority")),
+            order=_optional_int(data.get("item_order")),
+            due=SyncDue.from_json(data.get("due")),
+            is_deleted=bool(data.get("is_deleted")),
+            is_archived=bool(data.get("is_archived")),
         )
-        checked = data.get("checked")
-        completed = data.get("completed")
-        is_completed = bool(completed) or bool(checked)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SyncTask:
+        """Rebuild a task from the output of ``to_dict``."""
         return cls(
             id=str(data["id"]),
-            project_id=str(data["project_id"]) if data.get("project_id") is not None else None,
+            project_id=_pooled_id(data.get("project_id")),
             content=data.get("content") or "",
             description=data.get("description"),
-            is_completed=is_completed,
-            parent_id=str(data["parent_id"]) if data.get("parent_id") is not None else None,
-            labels=labels,
-            priority=int(data["priority"]) if data.get("priority") is not None else None,
-            order=int(data["item_order"]) if data.get("item_order") is not None else None,
-            due=due,
+            is_completed=bool(data.get("is_completed")),
+            parent_id=_pooled_id(data.get("parent_id")),
+            labels=_normalize_labels(data.get("labels")),
+            priority=data.get("priority"),
+            order=data.get("order"),
+            due=SyncDue.from_json(data.get("due")),
             is_deleted=bool(data.get("is_deleted")),
             is_archived=bool(data.get("is_archived")),
         )
@@ -163,6 +512,11 @@ class SyncProject:
             order=int(data["order"]) if data.get("order") is not None else None,
         )
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SyncProject:
+        """Rebuild a project from the output of ``to_dict``."""
+        return cls.from_json(data)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -197,6 +551,18 @@ class SyncLabel:
             order=int(data["item_order"]) if data.get("item_order") is not None else None,
         )
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> SyncLabel:
+        """Rebuild a label from the output of ``to_dict``."""
+        return cls(
+            id=str(data["id"]),
+            name=data.get("name") or "",
+            color=data.get("color"),
+            is_deleted=bool(data.get("is_deleted")),
+            is_favorite=bool(data.get("is_favorite")),
+            order=data.get("order"),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -217,7 +583,7 @@ class SyncResponse:
     tasks: list[SyncTask]
     projects: list[SyncProject]
     labels: list[SyncLabel]
-    raw: dict[str, Any]
+    raw: dict[str, Any] | None = None
 
 
 @dataclass(slots=True)
@@ -240,6 +606,252 @@ class CommandResult:
     temp_id_mapping: dict[str, str]
 
 
+_RESOURCE_PARSERS: dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    "items": SyncTask.from_json,
+    "projects": SyncProject.from_json,
+    "labels": SyncLabel.from_json,
+}
+# Top-level keys kept by the streaming decoder; everything else is skipped.
+_RETAINED_KEYS = frozenset(
+    {"sync_token", "full_sync", "sync_status", "temp_id_mapping", "error", "error_code"}
+)
+_WHITESPACE = frozenset(" \t\n\r")
+
+
+class SyncStreamDecoder:
+    """Incremental decoder for Sync response bodies.
+
+    Chunks are fed as they arrive. Elements of the ``items``, ``projects`` and
+    ``labels`` arrays are decoded and turned into ``SyncTask``/``SyncProject``/
+    ``SyncLabel`` objects as soon as each one is complete, so only the current
+    element and the retained top-level scalars are ever held as raw JSON.
+
+    With a fast codec, all complete elements in the buffer are decoded with a
+    single codec call instead of one ``raw_decode`` per element.
+    """
+
+    _START, _KEY, _COLON, _VALUE, _ARRAY, _DONE = range(6)
+
+    def __init__(self, codec: JsonCodec | None = None) -> None:
+        self._codec = codec or select_codec()
+        self._batching = self._codec.fast
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = self._START
+        self._key: str | None = None
+        self._retry_size = 0
+        self.scalars: dict[str, Any] = {}
+        self.resources: dict[str, list[Any]] = {key: [] for key in _RESOURCE_PARSERS}
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume a chunk of the body, materialising every completed element."""
+
+        self.bytes_read += len(chunk)
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk)
+        self._pos = 0
+        self._batching = self._codec.fast
+        if len(self._buffer) >= self._retry_size:
+            self._drain(final=False)
+
+    def close(self) -> None:
+        """Finish decoding; raises ``TodoistSyncError`` if the body was incomplete."""
+
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        self._drain(final=True)
+        if self._state != self._DONE:
+            raise TodoistSyncError("Truncated or malformed Sync response")
+
+    def _skip_whitespace(self) -> bool:
+        buffer, pos, end = self._buffer, self._pos, len(self._buffer)
+        while pos < end and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < end
+
+    def _decode_value(self, final: bool) -> tuple[bool, Any]:
+        """Decode one JSON value at the cursor; ``(False, None)`` if incomplete."""
+
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as err:
+            if final:
+                raise TodoistSyncError(f"Malformed Sync response: {err}") from err
+            # Wait for noticeably more data before re-scanning a partial value.
+            self._retry_size = 2 * (len(self._buffer) - self._pos)
+            return False, None
+        if end == len(self._buffer) and not final:
+            # A number at the end of the buffer may continue in the next chunk.
+            self._retry_size = len(self._buffer) - self._pos + 1
+            return False, None
+        self._pos = end
+        self._retry_size = 0
+        return True, value
+
+    def _drain(self, final: bool) -> None:
+        while self._state != self._DONE and self._skip_whitespace():
+            char = self._buffer[self._pos]
+            if self._state == self._START:
+                if char != "{":
+                    raise TodoistSyncError("Sync response is not a JSON object")
+                self._pos += 1
+                self._state = self._KEY
+            elif self._state == self._KEY:
+                if char == ",":
+                    self._pos += 1
+                elif char == "}":
+                    self._pos += 1
+                    self._state = self._DONE
+                else:
+                    complete, key = self._decode_value(final)
+                    if not complete:
+                        return
+                    self._key = key
+                    self._state = self._COLON
+            elif self._state == self._COLON:
+                if char != ":":
+                    raise TodoistSyncError("Malformed Sync response: expected ':'")
+                self._pos += 1
+                self._state = self._VALUE
+            elif self._state == self._VALUE:
+                if char == "[" and self._key in _RESOURCE_PARSERS:
+                    self._pos += 1
+                    self._state = self._ARRAY
+                    continue
+                complete, value = self._decode_value(final)
+                if not complete:
+                    return
+                if self._key in _RETAINED_KEYS:
+                    self.scalars[self._key] = value
+                self._state = self._KEY
+            else:  # _ARRAY
+                if char == ",":
+                    self._pos += 1
+                elif char == "]":
+                    self._pos += 1
+                    self._state = self._KEY
+                else:
+                    if self._batching and self._decode_batch():
+                        continue
+                    complete, element = self._decode_value(final)
+                    if not complete:
+                        return
+                    if element:
+                        key = self._key or ""
+                        self.resources[key].append(_RESOURCE_PARSERS[key](element))
+
+    def _decode_batch(self) -> bool:
+        """Decode every element up to the last ``},{`` boundary in one codec call.
+
+        A boundary found inside a string leaves that string unterminated, so the
+        codec rejects the slice; the decoder then falls back to per-element
+        decoding until the next chunk arrives.
+        """
+
+        boundary = self._buffer.rfind("},{", self._pos)
+        if boundary < 0:
+            return False
+        try:
+            elements = self._codec.loads("[" + self._buffer[self._pos : boundary + 1] + "]")
+        except ValueError:
+            self._batching = False
+            return False
+        key = self._key or ""
+        parser = _RESOURCE_PARSERS[key]
+        self.resources[key].extend(parser(element) for element in elements if element)
+        self._pos = boundary + 1
+        return True
+
+
+class RawResponseBuffer:
+    """Ring buffer of recent raw Sync bodies bounded by a total byte budget.
+
+    The oldest bodies are evicted first; a single body larger than the whole
+    budget is not retained at all.
+    """
+
+    def __init__(self, max_bytes: int = RAW_RESPONSE_BUDGET) -> None:
+        self.max_bytes = max_bytes
+        self._entries: deque[tuple[float, bytes]] = deque()
+        self._size = 0
+        self._dropped = 0
+
+    def append(self, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            self._dropped += 1
+            return
+        self._entries.append((time.time(), body))
+        self._size += len(body)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popleft()
+            self._size -= len(evicted)
+            self._dropped += 1
+
+    def skip(self) -> None:
+        """Count a body that outgrew the budget before it was fully read."""
+
+        self._dropped += 1
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the retained bodies, oldest first, decoded for diagnostics."""
+
+        return [
+            {"received": received, "bytes": len(body), "body": select_codec().loads(body)}
+            for received, body in self._entries
+        ]
+
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "count": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "dropped": self._dropped,
+        }
+
+
+@dataclass(slots=True)
+class _DecodedResponse:
+    """Typed Sync response plus the command bookkeeping it carries."""
+
+    sync: SyncResponse
+    status: dict[str, Any]
+    temp_id_mapping: dict[str, str]
+
+
+@dataclass(slots=True)
+class _CommandBatch:
+    """Commands collected during one batch window."""
+
+    sync_token: str | None
+    entries: list[tuple[list[dict[str, Any]], asyncio.Future[CommandResult]]] = field(
+        default_factory=list
+    )
+    resource_types: dict[str, None] = field(default_factory=dict)
+    hooks: list[ResponseHook] = field(default_factory=list)
+    command_count: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+    def add(
+        self,
+        commands: list[dict[str, Any]],
+        resource_types: Sequence[str],
+        future: asyncio.Future[CommandResult],
+        on_response: ResponseHook | None = None,
+    ) -> None:
+        self.entries.append((commands, future))
+        self.resource_types.update(dict.fromkeys(resource_types))
+        if on_response is not None:
+            self.hooks.append(on_response)
+        self.command_count += len(commands)
+
+    async def apply(self, response: SyncResponse) -> None:
+        for hook in self.hooks:
+            await hook(response)
+
+
 class TodoistSyncClient:
     """Client for Todoist Sync API minimal surface area."""
 
@@ -251,37 +863,90 @@ class TodoistSyncClient:
         logger: logging.Logger | None = None,
         max_retries: int = 3,
         request_timeout: int = 15,
+        batch_window: float | None = None,
+        sync_token_provider: Callable[[], str] | None = None,
+        retain_raw: bool = False,
+        raw_budget: int = RAW_RESPONSE_BUDGET,
+        codec: JsonCodec | None = None,
     ) -> None:
         self._session = session
         self._token = token
         self._logger = logger or _LOGGER
         self._max_retries = max(1, max_retries)
         self._timeout = request_timeout
-        self._lock = asyncio.Lock()
+        self._scheduler = SyncRequestScheduler()
+        self._sync_token_provider = sync_token_provider
+        self._batch_window = batch_window
+        self._batch: _CommandBatch | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self._rate_limiter = SyncRateLimiter()
+        self._raw_responses = RawResponseBuffer(raw_budget) if retain_raw else None
+        self._codec = codec or select_codec()
+
+    def rate_budget(self) -> tuple[float, float]:
+        """Return the unused share of the Sync quota and seconds left blocked."""
+
+        return self._rate_limiter.budget()
+
+    def rate_limit_diagnostics(self) -> dict[str, Any]:
+        """Return the remaining client-side request budget."""
+
+        return self._rate_limiter.diagnostics()
+
+    def scheduler_diagnostics(self) -> dict[str, Any]:
+        """Return per-priority queue metrics of the request scheduler."""
+
+        return self._scheduler.diagnostics()
+
+    def raw_response_diagnostics(self) -> dict[str, Any] | None:
+        """Return the retained raw responses, or ``None`` when retention is off."""
+
+        if self._raw_responses is None:
+            return None
+        return {
+            **self._raw_responses.diagnostics(),
+            "responses": self._raw_responses.entries(),
+        }
 
     async def sync(
         self,
         resource_types: Iterable[str],
         *,
-        sync_token: str = "*",
+        sync_token: str | None = "*",
+        priority: RequestPriority = RequestPriority.REFRESH,
+        on_response: ResponseHook | None = None,
     ) -> SyncResponse:
-        """Fetch data from the Sync API for the provided resources."""
+        """Fetch data from the Sync API for the provided resources.
+
+        Pass ``sync_token=None`` to use the token provider's value at the moment
+        the request is dispatched rather than when it was queued. ``on_response``
+        is awaited before the endpoint is released, so the next queued request
+        already sees the token the response produced.
+        """
 
         payload = {
             "sync_token": sync_token,
             "resource_types": list(resource_types),
         }
-        response = await self._request(payload)
-        return self._parse_sync_response(response)
+        response = await self._request(payload, priority=priority, on_response=on_response)
+        return response.sync
 
     async def execute_commands(
         self,
         commands: Sequence[MutableMapping[str, Any]],
         *,
-        sync_token: str = "*",
+        sync_token: str | None = "*",
         resource_types: Iterable[str] | None = None,
+        on_response: ResponseHook | None = None,
     ) -> CommandResult:
-        """Submit commands and return their outcome along with updated resources."""
+        """Submit commands and return their outcome along with updated resources.
+
+        When a batch window is configured, commands submitted within the window
+        are sent together in a single request (up to ``SYNC_COMMAND_LIMIT``).
+        Each caller still receives only its own ``sync_status`` entries and
+        ``temp_id_mapping``. ``on_response`` behaves as in ``sync``; in a batch
+        every caller's hook runs on the shared response.
+        """
 
         normalized: list[dict[str, Any]] = []
         for original in commands:
@@ -292,17 +957,46 @@ class TodoistSyncClient:
                 command["uuid"] = uuid.uuid4().hex
             normalized.append(command)
 
+        resources = tuple(resource_types or ())
+        if self._batch_window is None or len(normalized) >= SYNC_COMMAND_LIMIT:
+            response = await self._send_commands(
+                normalized, sync_token, resources, on_response
+            )
+            return self._command_result(response, normalized)
+        return await self._enqueue_commands(normalized, sync_token, resources, on_response)
+
+    async def _send_commands(
+        self,
+        commands: Sequence[Mapping[str, Any]],
+        sync_token: str | None,
+        resource_types: Sequence[str],
+        on_response: ResponseHook | None = None,
+    ) -> _DecodedResponse:
+        """POST a list of commands and parse the shared response."""
+
         payload = {
             "sync_token": sync_token,
-            "commands": normalized,
-            "resource_types": list(resource_types or []),
+            "commands": list(commands),
+            "resource_types": list(resource_types),
         }
-        response = await self._request(payload)
-        sync = self._parse_sync_response(response)
-        status = response.get("sync_status") or {}
+        return await self._request(
+            payload, priority=RequestPriority.INTERACTIVE, on_response=on_response
+        )
+
+    def _command_result(
+        self,
+        response: _DecodedResponse,
+        commands: Sequence[Mapping[str, Any]],
+    ) -> CommandResult:
+        """Build the result for ``commands`` out of a (possibly shared) response."""
+
+        command_uuids = {str(command["uuid"]) for command in commands}
+        temp_ids = {str(command["temp_id"]) for command in commands if "temp_id" in command}
         succeeded: list[str] = []
         failed: list[CommandError] = []
-        for command_uuid, result in status.items():
+        for command_uuid, result in response.status.items():
+            if command_uuid not in command_uuids:
+                continue
             if isinstance(result, Mapping):
                 failed.append(
                     CommandError(
@@ -323,19 +1017,94 @@ class TodoistSyncClient:
                         details=result,
                     )
                 )
-        temp_id_mapping = {
-            str(temp_id): str(real_id)
-            for temp_id, real_id in (response.get("temp_id_mapping") or {}).items()
-        }
         return CommandResult(
-            sync=sync,
+            sync=response.sync,
             succeeded=succeeded,
             failed=failed,
-            temp_id_mapping=temp_id_mapping,
+            temp_id_mapping={
+                temp_id: real_id
+                for temp_id, real_id in response.temp_id_mapping.items()
+                if temp_id in temp_ids
+            },
+        )
+
+    async def _enqueue_commands(
+        self,
+        commands: list[dict[str, Any]],
+        sync_token: str | None,
+        resource_types: Sequence[str],
+        on_response: ResponseHook | None = None,
+    ) -> CommandResult:
+        """Add commands to the open batch and wait for the batch to be sent."""
+
+        loop = asyncio.get_running_loop()
+        batch = self._batch
+        if batch is not None and batch.command_count + len(commands) > SYNC_COMMAND_LIMIT:
+            self._flush_batch()
+            batch = None
+        if batch is None:
+            # The first caller's token is used; callers normally defer it to dispatch time.
+            batch = self._batch = _CommandBatch(sync_token=sync_token)
+            batch.timer = loop.call_later(self._batch_window or 0, self._flush_batch)
+
+        future: asyncio.Future[CommandResult] = loop.create_future()
+        batch.add(commands, resource_types, future, on_response)
+        if batch.command_count >= SYNC_COMMAND_LIMIT:
+            self._flush_batch()
+        return await future
+
+    def _flush_batch(self) -> None:
+        """Close the open batch and send it in the background."""
+
+        batch, self._batch = self._batch, None
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: _CommandBatch) -> None:
+        """Send a closed batch and resolve every caller's future."""
+
+        commands = [command for entry, _ in batch.entries for command in entry]
+        self._logger.debug(
+            "Sending batched Todoist commands | callers=%d commands=%d",
+            len(batch.entries),
+            len(commands),
         )
+        try:
+            response = await self._send_commands(
+                commands,
+                batch.sync_token,
+                tuple(batch.resource_types),
+                batch.apply if batch.hooks else None,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in batch.entries:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for entry, future in batch.entries:
+            if not future.done():
+                future.set_result(self._command_result(response, entry))
 
-    async def _request(self, payload: Mapping[str, Any]) -> dict[str, Any]:
-        """Issue a POST to the Sync endpoint with retries and backoff."""
+    async def _request(
+        self,
+        payload: Mapping[str, Any],
+        *,
+        priority: RequestPriority = RequestPriority.REFRESH,
+        on_response: ResponseHook | None = None,
+    ) -> _DecodedResponse:
+        """Issue a POST to the Sync endpoint with retries and backoff.
+
+        Budget waits and retry sleeps happen outside the scheduler slot so they
+        never hold up other callers; only the HTTP exchange and ``on_response``
+        are serialised. Running the hook inside the slot means a queued request
+        with a deferred token is only sent once this response has been applied,
+        so it never repeats the old token (or a second full sync).
+        """
 
         headers = {
             "Authorization": f"Bearer {self._token}",
@@ -344,93 +1113,155 @@ class TodoistSyncClient:
         attempt = 0
         delay = 1.0
         last_error: Exception | None = None
-        async with self._lock:
-            while attempt < self._max_retries:
-                attempt += 1
-                try:
-                    async with self._session.post(
-                        SYNC_BASE_URL,
-                        json=payload,
-                        headers=headers,
-                        timeout=self._timeout,
-                    ) as response:
-                        if response.status == 401:
-                            raise TodoistSyncAuthError("Unauthorized")
-                        if response.status == 429:
-                            retry_after_header = response.headers.get("Retry-After")
-                            retry_after = (
-                                float(retry_after_header)
-                                if retry_after_header is not None
-                                else None
-                            )
-                            raise TodoistSyncRateLimitError(retry_after)
-                        if response.status >= 400:
-                            body = await response.text()
-                            raise TodoistSyncError(
-                                f"Todoist Sync API HTTP {response.status}: {body}"
-                            )
-                        body = await response.text()
-                        if not body:
-                            raise TodoistSyncError("Empty response from Sync API")
-                        payload_json = json.loads(body)
-                        if payload_json.get("sync_token") == "RESET":
-                            raise TodoistSyncTokenReset("Sync token reset required")
-                        if payload_json.get("error_code"):
-                            raise TodoistSyncError(
-                                f"Todoist Sync error {payload_json.get('error_code')}: {payload_json.get('error')}"
-                            )
-                        return payload_json
-                except TodoistSyncRateLimitError as err:
-                    last_error = err
-                    wait_time = err.retry_after or delay
-                    self._logger.warning(
-                        "Todoist Sync API rate limited, retrying in %.1f seconds", wait_time
-                    )
-                    await asyncio.sleep(wait_time)
-                    delay *= 2
-                except (ClientError, asyncio.TimeoutError) as err:
-                    last_error = err
-                    if attempt >= self._max_retries:
-                        break
-                    self._logger.warning(
-                        "Todoist Sync request failed (%s), retrying in %.1f seconds",
-                        err,
-                        delay,
-                    )
-                    await asyncio.sleep(delay)
-                    delay *= 2
-                except TodoistSyncError as err:
-                    raise err
-                except Exception as err:  # pylint: disable=broad-except
-                    last_error = err
-                    if attempt >= self._max_retries:
-                        break
-                    self._logger.exception(
-                        "Unexpected Todoist Sync error, retrying in %.1f seconds",
-                        delay,
-                    )
-                    await asyncio.sleep(delay)
-                    delay *= 2
+        while attempt < self._max_retries:
+            attempt += 1
+            hook_error: BaseException | None = None
+            deferred_token = payload.get("sync_token") is None
+            expected_token = (
+                self._current_sync_token() if deferred_token else payload["sync_token"]
+            )
+            full_sync = expected_token == "*" and not payload.get("commands")
+            await self._rate_limiter.acquire(priority, full_sync=full_sync)
+            try:
+                async with self._scheduler.slot(priority):
+                    request_payload = payload
+                    if deferred_token:
+                        # Resolve now so a request that waited in the queue uses
+                        # the token produced by whatever ran ahead of it.
+                        request_payload = {**payload, "sync_token": self._current_sync_token()}
+                    response = await self._post(request_payload, headers)
+                    if on_response is not None:
+                        try:
+                            await on_response(response.sync)
+                        except BaseException as err:  # noqa: BLE001 - re-raised below
+                            # The request went through; never retry it because
+                            # applying the reply failed.
+                            hook_error = err
+            except TodoistSyncRateLimitError as err:
+                last_error = err
+                self._rate_limiter.penalize(err.retry_after)
+                wait_time = err.retry_after or delay
+                self._logger.warning(
+                    "Todoist Sync API rate limited, retrying in %.1f seconds", wait_time
+                )
+                await asyncio.sleep(wait_time)
+                delay *= 2
+            except (ClientError, asyncio.TimeoutError) as err:
+                last_error = err
+                if attempt >= self._max_retries:
+                    break
+                self._logger.warning(
+                    "Todoist Sync request failed (%s), retrying in %.1f seconds",
+                    err,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+            except TodoistSyncError as err:
+                raise err
+            except Exception as err:  # pylint: disable=broad-except
+                last_error = err
+                if attempt >= self._max_retries:
+                    break
+                self._logger.exception(
+                    "Unexpected Todoist Sync error, retrying in %.1f seconds",
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                if hook_error is not None:
+                    raise hook_error
+                return response
         raise TodoistSyncRequestError(last_error or Exception("Sync request failed"))
 
-    def _parse_sync_response(self, response: Mapping[str, Any]) -> SyncResponse:
-        """Translate the JSON response into typed objects."""
+    def _current_sync_token(self) -> str:
+        if self._sync_token_provider is None:
+            return "*"
+        return self._sync_token_provider() or "*"
 
-        tasks_raw = response.get("items") or []
-        projects_raw = response.get("projects") or []
-        labels_raw = response.get("labels") or []
-        tasks = [SyncTask.from_json(task) for task in tasks_raw if task]
-        projects = [SyncProject.from_json(project) for project in projects_raw if project]
-        labels = [SyncLabel.from_json(label) for label in labels_raw if label]
-        sync_token = response.get("sync_token")
+    async def _post(
+        self, payload: Mapping[str, Any], headers: Mapping[str, str]
+    ) -> _DecodedResponse:
+        """Perform a single POST and stream-decode the body."""
+
+        async with self._session.post(
+            SYNC_BASE_URL,
+            data=self._codec.dumps(payload),
+            headers=headers,
+            timeout=self._timeout,
+        ) as response:
+            if response.status == 401:
+                raise TodoistSyncAuthError("Unauthorized")
+            if response.status == 429:
+                retry_after_header = response.headers.get("Retry-After")
+                retry_after = (
+                    float(retry_after_header)
+                    if retry_after_header is not None
+                    else None
+                )
+                raise TodoistSyncRateLimitError(retry_after)
+            if response.status >= 400:
+                body = await response.text()
+                raise TodoistSyncError(
+                    f"Todoist Sync API HTTP {response.status}: {body}"
+                )
+            decoder = SyncStreamDecoder(self._codec)
+            raw_responses = self._raw_responses
+            body = bytearray() if raw_responses is not None else None
+            loop = asyncio.get_running_loop()
+            # Small deltas are decoded inline; once a body is known or seen to
+            # be large, the remaining chunks are decoded in the executor so a
+            # full sync does not block the event loop. Chunks are awaited one
+            # at a time, so the decoder is never touched concurrently.
+            offload = (response.content_length or 0) >= EXECUTOR_THRESHOLD_BYTES
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                if offload:
+                    await loop.run_in_executor(None, decoder.feed, chunk)
+                else:
+                    decoder.feed(chunk)
+                    offload = decoder.bytes_read >= EXECUTOR_THRESHOLD_BYTES
+                if body is not None:
+                    body += chunk
+                    if len(body) > raw_responses.max_bytes:
+                        # Too large to retain; stop copying the rest of it.
+                        raw_responses.skip()
+                        body = None
+            if not decoder.bytes_read:
+                raise TodoistSyncError("Empty response from Sync API")
+            if offload:
+                await loop.run_in_executor(None, decoder.close)
+            else:
+                decoder.close()
+            if body is not None:
+                raw_responses.append(bytes(body))
+            return self._parse_decoded(decoder)
+
+    def _parse_decoded(self, decoder: SyncStreamDecoder) -> _DecodedResponse:
+        """Validate the retained scalars and assemble the typed response."""
+
+        scalars = decoder.scalars
+        if scalars.get("sync_token") == "RESET":
+            raise TodoistSyncTokenReset("Sync token reset required")
+        if scalars.get("error_code"):
+            raise TodoistSyncError(
+                f"Todoist Sync error {scalars.get('error_code')}: {scalars.get('error')}"
+            )
+        sync_token = scalars.get("sync_token")
         if not isinstance(sync_token, str):
             raise TodoistSyncError("Sync response missing sync_token")
-        full_sync = bool(response.get("full_sync"))
-        return SyncResponse(
+        sync = SyncResponse(
             sync_token=sync_token,
-            full_sync=full_sync,
-            tasks=tasks,
-            projects=projects,
-            labels=labels,
-            raw=dict(response),
+            full_sync=bool(scalars.get("full_sync")),
+            tasks=decoder.resources["items"],
+            projects=decoder.resources["projects"],
+            labels=decoder.resources["labels"],
+        )
+        return _DecodedResponse(
+            sync=sync,
+            status=dict(scalars.get("sync_status") or {}),
+            temp_id_mapping={
+                str(temp_id): str(real_id)
+                for temp_id, real_id in (scalars.get("temp_id_mapping") or {}).items()
+            },
         )
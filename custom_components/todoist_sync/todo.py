@@ -13,63 +13,17 @@ from homeassistant.components.todo import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from homeassistant.util import dt as dt_util
 
 
-def _parse_due_datetime(due_obj: Any) -> datetime.datetime | None:
-    """Return a timezone-aware datetime for a Todoist due entry."""
-
-    raw_datetime = getattr(due_obj, "datetime", None)
-    if not raw_datetime:
-        raw_date = getattr(due_obj, "date", None)
-        if isinstance(raw_date, str) and "T" in raw_date:
-            raw_datetime = raw_date
-
-    if not raw_datetime:
-        return None
-
-    parsed = dt_util.parse_datetime(raw_datetime)
-    if parsed is None:
-        try:
-            parsed = datetime.datetime.fromisoformat(raw_datetime)
-        except (TypeError, ValueError):
-            return None
-
-    if parsed.tzinfo is None:
-        timezone = getattr(due_obj, "timezone", None)
-        tzinfo = dt_util.get_time_zone(timezone) if timezone else dt_util.DEFAULT_TIME_ZONE
-        parsed = parsed.replace(tzinfo=tzinfo)
-
-    return parsed
-
-
-def _parse_due_date(due_obj: Any) -> datetime.date | None:
-    """Return a date object for a Todoist due entry."""
-
-    raw_date = getattr(due_obj, "date", None)
-    if raw_date is None:
-        return None
-
-    if isinstance(raw_date, datetime.date):
-        return raw_date
-
-    if isinstance(raw_date, str):
-        raw_value = raw_date.split("T")[0]
-        parsed = dt_util.parse_date(raw_value)
-        if parsed is not None:
-            return parsed
-        try:
-            return datetime.date.fromisoformat(raw_value)
-        except ValueError:
-            return None
-
-    return None
-
 from .const import DOMAIN
 from .coordinator import TodoistDataUpdateCoordinator
+from .due import resolve_due
+from .entity import TodoistProjectEntity
+from .item_diff import minimal_item_update, prepare_item_args
 from .types import TodoistData
 
 
@@ -81,60 +35,7 @@ def _payload_requires_update(task: Any | None, payload: dict[str, Any]) -> bool:
 
     if task is None:
         return True
-
-    content = payload.get("content")
-    if content is not None and getattr(task, "content", None) != content:
-        return True
-
-    description = payload.get("description")
-    if description is not None and getattr(task, "description", None) != description:
-        return True
-
-    due_info = getattr(task, "due", None)
-    if "due_datetime" in payload:
-        due_dt = payload["due_datetime"]
-        existing_iso = getattr(due_info, "datetime", None)
-        if existing_iso is None:
-            return True
-
-        def _normalise_datetime(value: Any) -> datetime.datetime | None:
-            candidate = value
-            if not isinstance(candidate, datetime.datetime):
-                parsed = dt_util.parse_datetime(str(candidate))
-                if parsed is None:
-                    try:
-                        parsed = datetime.datetime.fromisoformat(str(candidate))
-                    except (TypeError, ValueError):
-                        return None
-                candidate = parsed
-            if candidate.tzinfo is None:
-                candidate = candidate.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-            return dt_util.as_utc(candidate)
-
-        desired_dt = _normalise_datetime(due_dt)
-        existing_dt = _normalise_datetime(existing_iso)
-        if desired_dt is None or existing_dt is None:
-            return True
-        if desired_dt != existing_dt:
-            return True
-
-    if "due_date" in payload:
-        due_date = payload["due_date"]
-        due_date_str = due_date.isoformat() if hasattr(due_date, "isoformat") else str(due_date)
-        existing_date = getattr(due_info, "date", None)
-        if existing_date != due_date_str:
-            return True
-
-    if "due_string" in payload:
-        due_string = payload["due_string"]
-        existing_string = getattr(due_info, "string", None)
-        if due_string == "no date" and not existing_string and due_info is None:
-            pass
-        elif due_info is None or existing_string != due_string:
-            return True
-
-    # No relevant differences detected.
-    return False
+    return bool(minimal_item_update(task, prepare_item_args(payload)))
 
 
 async def async_setup_entry(
@@ -177,9 +78,7 @@ def _task_api_data(item: TodoItem, api_data: Any | None = None) -> dict[str, Any
     return item_data
 
 
-class TodoistTodoListEntity(
-    CoordinatorEntity[TodoistDataUpdateCoordinator], TodoListEntity
-):
+class TodoistTodoListEntity(TodoistProjectEntity, TodoListEntity):
     """A Todoist TodoListEntity."""
 
     _attr_supported_features = (
@@ -198,10 +97,11 @@ class TodoistTodoListEntity(
         project_name: str,
     ) -> None:
         """Initialize TodoistTodoListEntity."""
-        super().__init__(coordinator=coordinator)
-        self._project_id = project_id
+        super().__init__(coordinator, project_id)
         self._attr_unique_id = f"{coordinator.entry.entry_id}-{project_id}"
         self._attr_name = project_name
+        self._todo_items: list[TodoItem] | None = None
+        self._todo_items_key: tuple[Any, ...] | None = None
 
     def _log_timing(self, label: str, started: float, **context: Any) -> None:
         """Log the elapsed time for a given label."""
@@ -219,16 +119,22 @@ class TodoistTodoListEntity(
 
     @property
     def todo_items(self) -> list[TodoItem] | None:
-        """Get the current set of To-do items."""
-        started = time.perf_counter()
-        self._log_debug("Building todo_items snapshot", project_id=self._project_id)
+        """Get the current set of To-do items.
+
+        The list is rebuilt only when a snapshot changed this project (or Home
+        Assistant's time zone, which the due datetimes are localized to).
+        """
         if self.coordinator.data is None:
-            self._log_timing("todo_items", started, status="no-data")
             return None
+        key = (
+            self.coordinator.project_revision(self._project_id),
+            dt_util.DEFAULT_TIME_ZONE,
+        )
+        if key == self._todo_items_key:
+            return self._todo_items
+        started = time.perf_counter()
         items = []
-        for task in self.coordinator.data.tasks:
-            if task.project_id != self._project_id:
-                continue
+        for task in self.coordinator.tasks_by_project.get(self._project_id):
             if task.parent_id is not None:
                 continue
             status = (
@@ -236,15 +142,8 @@ class TodoistTodoListEntity(
                 if task.is_completed
                 else TodoItemStatus.NEEDS_ACTION
             )
-            due: datetime.date | datetime.datetime | None = None
-            if task.due:
-                due_datetime = _parse_due_datetime(task.due)
-                if due_datetime is not None:
-                    due = dt_util.as_local(due_datetime)
-                else:
-                    due_date = _parse_due_date(task.due)
-                    if due_date is not None:
-                        due = dt_util.start_of_local_day(due_date)
+            resolved = resolve_due(task.due)
+            due = resolved.start if resolved is not None else None
             items.append(
                 TodoItem(
                     summary=task.content,
@@ -254,7 +153,9 @@ class TodoistTodoListEntity(
                     description=task.description,
                 )
             )
-        self._log_timing("todo_items", started, count=len(items))
+        self._todo_items = items
+        self._todo_items_key = key
+        self._log_timing("todo_items", started, count=len(items), revision=key[0])
         return items
 
     async def async_create_todo_item(self, item: TodoItem) -> None:
@@ -293,9 +194,11 @@ class TodoistTodoListEntity(
         update_payload = payload if needs_update else {}
 
         def _command_updated_task(result: Any | None) -> bool:
+            if result is None:
+                # Nothing was sent (coalesced away), so there is nothing to fetch.
+                return True
             return bool(
-                result
-                and getattr(result, "sync", None)
+                getattr(result, "sync", None)
                 and any(getattr(task, "id", None) == uid for task in result.sync.tasks)
             )
 
@@ -351,17 +254,17 @@ class TodoistTodoListEntity(
 
         started = time.perf_counter()
         self._log_debug("Deleting Todoist tasks", uids=uids)
-        *leading, final = uids
-        for uid in leading:
-            await self.coordinator.async_delete_task(uid, refresh=False)
-        await self.coordinator.async_delete_task(final, refresh=False)
-        self._schedule_full_refresh()
+        result = await self.coordinator.async_bulk_delete(uids)
         self._log_timing(
             "async_delete_todo_items",
             started,
             count=len(uids),
-            transport="sync",
+            failed=len(result.failed),
+            transport="sync-bulk",
         )
+        if result.failed:
+            errors = ", ".join(f"{uid}:{error}" for uid, error in result.failed.items())
+            raise HomeAssistantError(f"Failed to delete Todoist task(s): {errors}")
 
     def _schedule_task_refresh(self, task_id: str) -> None:
         """Refresh a single task in the background."""
@@ -375,4 +278,4 @@ class TodoistTodoListEntity(
 
         if self.hass is None:
             return
-        self.hass.async_create_task(self.coordinator.async_refresh())
+        self.hass.async_create_task(self.coordinator.async_request_full_refresh())
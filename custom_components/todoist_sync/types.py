@@ -1,15 +1,92 @@
 """Types for the Todoist Sync component."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 
 @dataclass
 class TodoistData:
-    """Data snapshot for the Todoist Sync integration."""
+    """Data snapshot for the Todoist Sync integration.
 
-    tasks: list[Any]
-    projects: list[Any]
-    labels: list[Any]
+    The collections are ordered, read-only views over the coordinator's keyed
+    stores rather than copies. ``revision`` increases with every snapshot the
+    coordinator publishes.
+    """
+
+    tasks: Sequence[Any]
+    projects: Sequence[Any]
+    labels: Sequence[Any]
     last_update: float
+    revision: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """Coordinator listener context limiting updates to a single project."""
+
+    project_id: str
+    labels: bool = False
+
+
+@dataclass(slots=True)
+class TodoistChangeSet:
+    """Resource ids added, updated or removed by one applied Sync response."""
+
+    full_sync: bool = False
+    added_tasks: set[str] = field(default_factory=set)
+    updated_tasks: set[str] = field(default_factory=set)
+    removed_tasks: set[str] = field(default_factory=set)
+    added_projects: set[str] = field(default_factory=set)
+    updated_projects: set[str] = field(default_factory=set)
+    removed_projects: set[str] = field(default_factory=set)
+    added_labels: set[str] = field(default_factory=set)
+    updated_labels: set[str] = field(default_factory=set)
+    removed_labels: set[str] = field(default_factory=set)
+    affected_projects: set[str] = field(default_factory=set)
+
+    @property
+    def labels_changed(self) -> bool:
+        """Return True if any label was added, updated or removed."""
+        return bool(self.added_labels or self.updated_labels or self.removed_labels)
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if the response did not change any cached resource."""
+        return not (
+            self.full_sync
+            or self.affected_projects
+            or self.labels_changed
+        )
+
+    def merge(self, other: TodoistChangeSet) -> None:
+        """Fold the changes of a later response into this change set."""
+        self.full_sync = self.full_sync or other.full_sync
+        for name in (
+            "added_tasks",
+            "updated_tasks",
+            "removed_tasks",
+            "added_projects",
+            "updated_projects",
+            "removed_projects",
+            "added_labels",
+            "updated_labels",
+            "removed_labels",
+            "affected_projects",
+        ):
+            getattr(self, name).update(getattr(other, name))
+
+    def affects(self, context: ProjectContext) -> bool:
+        """Return True if listeners registered with ``context`` must recompute."""
+        if self.full_sync or context.project_id in self.affected_projects:
+            return True
+        return context.labels and self.labels_changed
+
+
+@dataclass(slots=True)
+class BulkCommandResult:
+    """Per-task outcome of a bulk coordinator operation."""
+
+    succeeded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
@@ -0,0 +1,80 @@
+"""Todoist webhook receiver that triggers debounced delta syncs."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_WEBHOOK_SECRET
+from .coordinator import TodoistDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Todoist signs every delivery with HMAC-SHA256 of the body, keyed by the
+# app's client secret, and sends it base64-encoded in this header.
+SIGNATURE_HEADER = "X-Todoist-Hmac-SHA256"
+
+
+def compute_signature(secret: str, body: bytes) -> str:
+    """Return the base64 HMAC-SHA256 signature Todoist sends for ``body``."""
+
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).digest()
+    return base64.b64encode(digest).decode()
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Return True when ``signature`` matches ``body`` under ``secret``."""
+
+    if not signature:
+        return False
+    return hmac.compare_digest(compute_signature(secret, body), signature)
+
+
+def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: TodoistDataUpdateCoordinator
+) -> None:
+    """Register the Todoist webhook endpoint for a config entry."""
+
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+    secret = entry.options.get(CONF_WEBHOOK_SECRET) or ""
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        body = await request.read()
+        if not secret or not verify_signature(
+            secret, body, request.headers.get(SIGNATURE_HEADER)
+        ):
+            coordinator.record_webhook_rejection("signature")
+            return web.Response(status=401)
+        try:
+            event_name = json.loads(body)["event_name"]
+        except (ValueError, KeyError, TypeError):
+            coordinator.record_webhook_rejection("payload")
+            return web.Response(status=400)
+        await coordinator.async_handle_webhook_event(str(event_name))
+        return web.Response(status=200)
+
+    webhook.async_register(
+        hass,
+        entry.domain,
+        entry.title or "Todoist Sync",
+        webhook_id,
+        _async_handle_webhook,
+        local_only=False,
+        allowed_methods=["POST"],
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+    _LOGGER.info(
+        "Todoist webhook endpoint registered; configure %s as the callback URL",
+        webhook.async_generate_url(hass, webhook_id),
+    )
@@ -0,0 +1,76 @@
+"""Post signed Todoist-style webhook events to a Home Assistant instance.
+
+Usage::
+
+    python scripts/webhook_standin.py URL --secret CLIENT_SECRET \
+        [--event item:added] [--count 1] [--bad-signature]
+
+``URL`` is the callback URL logged by the integration when the webhook option
+is enabled. Events are signed exactly like Todoist deliveries (base64
+HMAC-SHA256 of the body in ``X-Todoist-Hmac-SHA256``), so a burst posted with
+``--count`` should show up as a single ``webhook_sync`` in the debug log and
+in the diagnostics counters; ``--bad-signature`` exercises the 401 path.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+
+def build_event(event_name: str) -> dict:
+    task_id = str(int(time.time() * 1000))
+    return {
+        "event_name": event_name,
+        "user_id": "1",
+        "version": "10",
+        "initiator": {"id": "1", "email": "standin@example.com", "full_name": "Stand-in"},
+        "triggered_at": time.strftime("%Y-%m-%dT%H:%M:%S.000000Z", time.gmtime()),
+        "event_data": {"id": task_id, "content": "Stand-in task", "project_id": "0"},
+    }
+
+
+def post(url: str, secret: str, event: dict, *, bad_signature: bool) -> int:
+    body = json.dumps(event).encode()
+    key = (secret + "-wrong" if bad_signature else secret).encode()
+    signature = base64.b64encode(hmac.new(key, body, hashlib.sha256).digest()).decode()
+    request = urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            "X-Todoist-Hmac-SHA256": signature,
+            "X-Todoist-Delivery-ID": uuid.uuid4().hex,
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as err:
+        return err.code
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--event", default="item:added")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--bad-signature", action="store_true")
+    args = parser.parse_args()
+
+    for _ in range(args.count):
+        event = build_event(args.event)
+        status = post(args.url, args.secret, event, bad_signature=args.bad_signature)
+        print(f"{args.event}: HTTP {status}")
+
+
+if __name__ == "__main__":
+    main()